@@ -1,9 +1,14 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any
 
+import orjson
 from fastmcp import FastMCP
 
-from dart_mcp.settings.startup import fetch_dart_corp_list
+from dart_mcp.api_clients.base.http import aclose_client
+from dart_mcp.settings.startup import start_fetch_dart_corp_list
 from dart_mcp.tools import (
     find_company_corp_code_by_name,
     get_company_financial_stmt_list,
@@ -12,18 +17,44 @@ from dart_mcp.tools import (
     get_investment_summary,
     get_people_summary,
     get_stock_summary,
+    warm_up_company_search,
 )
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """
+    서버 시작 시 DART 기업 목록 적재와 회사명 검색 준비를 백그라운드로 시작하고,
+    종료 시 공유 HTTP 클라이언트의 연결 풀을 정리합니다.
+    """
+    fetch_task = start_fetch_dart_corp_list()
+    warm_up_task = asyncio.create_task(warm_up_company_search())
+    try:
+        yield
+    finally:
+        warm_up_task.cancel()
+        fetch_task.cancel()
+        await aclose_client()
+
+
+def _serialize_tool_result(data: Any) -> str:
+    """
+    도구 반환값을 orjson으로 직렬화합니다.
+    기본 직렬화(들여쓰기 2칸)와 달리 공백 없이 출력하여 LLM에 전달되는 토큰 수를 줄입니다.
+    """
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 mcp = FastMCP(
     "DART:KOREA FINANCIAL INFORMATION",
     instructions="""
     이 서버는 대한민국 기업의 재무제표 데이터를 제공합니다.
     모든 조회 결과는 이해하기 쉬운 말로 설명해주셔야합니다.
     """,
+    lifespan=lifespan,
+    tool_serializer=_serialize_tool_result,
 )
 
-fetch_dart_corp_list()
-
 
 @mcp.tool()
 async def get_today() -> str:
@@ -38,7 +69,9 @@ async def find_company_by_name(
 ) -> list[dict[str, Any]]:
     """
     회사명을 이용하여 기업의 고유 코드를 조회합니다.
-    회사를 조회 할 때는, LIKE 문을 사용하므로 이를 고려해서 입력해주세요
+    회사명에 입력값이 포함된 회사를 찾습니다. (대소문자와 앞뒤 공백은 무시)
+    입력과 정확히 일치하는 회사가 맨 앞에 오고, 나머지는 문자 2-gram 유사도가 높은 순으로 정렬합니다.
+    같은 입력의 결과는 일정 시간 캐시됩니다.
 
     Args:
         corp_name (str): 조회할 회사명
@@ -2,20 +2,102 @@
 # - 핵심 책임: DART API의 정기보고서 내 주요 정보 관련 엔드포인트 호출을 위한 공통 템플릿을 제공합니다.
 # - 설계 원칙: DRY (Don't Repeat Yourself) - 중복되는 API 호출 로직을 통합하여 관리합니다.
 # - 기술적 고려사항: 비동기 처리를 위해 httpx.AsyncClient를 사용합니다.
-# 로깅을 통해 API 호출 및 응답 상태를 기록합니다.
+# HTTP 요청은 `http` 모듈의 `request_json`(공유 AsyncClient + 동시성 제한)을 사용합니다.
+# 동일한 URL(corp_code/bsns_year/reprt_code 조합)의 반복 요청은 TTL+LRU 캐시에서 응답하며,
+# 진행 중인 사업연도의 응답과 데이터가 없는 응답(013)은 새로 제출된 보고서가 빨리 보이도록 짧은 TTL로 캐시합니다.
+# 같은 URL에 대한 요청이 이미 진행 중이면 새 요청을 보내지 않고 진행 중인 요청의 결과를 함께 기다립니다.
+# 지난 사업연도 응답은 `disk_cache` 모듈을 통해 SQLite에도 저장하여 재시작 후에도 재사용합니다.
+# 네트워크 오류, 429, 5xx 응답의 재시도는 `request_json`이 담당하며, 재시도 후에도 실패하면 빈 리스트로 처리합니다.
+# 로깅을 통해 API 호출 및 응답 상태를 기록합니다. (로그 레벨이 꺼져 있으면 포맷팅하지 않도록 %-스타일 인자 사용)
 # 타입 힌트를 사용하여 코드의 명확성을 높입니다. (Python 3.9+ 스타일 사용)
 # - 사용 시 고려사항: 이 함수는 DART API의 공통적인 응답 구조를 처리하며,
 # 'list' 필드를 반환하거나 오류/데이터 없음 시 빈 리스트를 반환합니다.
 # 특정 API의 세부적인 데이터 가공은 이 함수를 호출하는 쪽에서 처리해야 합니다.
+# 단순한 필드 제거/코드 매핑은 각 모듈이 `EndpointSpec`을 선언하고 `process_items`로 처리합니다.
+# 여러 엔드포인트를 동시에 호출하는 모듈은 `gather_endpoint_results`로 실패한 엔드포인트를 빈 리스트로 대체합니다.
+# 요약 도구는 `drop_empty_fields`로 값이 없는 필드를 같은 규칙으로 제거합니다.
+# 남길 필드 목록을 선언하는 모듈은 `select_fields`를 사용해, 응답에 없는 필드는 결과에서 생략하는 규칙을 공유합니다.
 
+import asyncio
 import logging
+import time
+from collections import Counter
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import orjson
+
+from dart_mcp.settings.config import get_settings
+
+from . import disk_cache
+from .http import request_json
 
 logger = logging.getLogger(__name__)
 
 
+def report_url_builder(endpoint: str) -> Callable[[str, str, str], str]:
+    """
+    정기보고서 엔드포인트별 URL(base_url 기준 상대 경로) 생성 함수를 만듭니다.
+
+    URL 템플릿은 import 시 한 번만 만들어지며, 요청마다 `%` 포매팅으로
+    corp_code, bsns_year, reprt_code만 채워 넣습니다.
+    """
+    template = f"{endpoint}.json?corp_code=%s&bsns_year=%s&reprt_code=%s"
+
+    def build(corp_code: str, bsns_year: str, reprt_code: str) -> str:
+        return template % (corp_code, bsns_year, reprt_code)
+
+    return build
+
+
+_response_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+_inflight: dict[str, asyncio.Task[list[dict[str, Any]]]] = {}
+
+
+def _get_cached_response(final_url: str) -> list[dict[str, Any]] | None:
+    """캐시된 응답이 유효하면 그 복사본을, 없거나 만료되었으면 None을 반환합니다."""
+    entry = _response_cache.get(final_url)
+    if entry is None:
+        return None
+    expires_at, items = entry
+    if expires_at < time.monotonic():
+        _response_cache.pop(final_url, None)
+        return None
+    # 최근 사용 항목을 맨 뒤로 옮겨 LRU 순서를 유지
+    _response_cache[final_url] = _response_cache.pop(final_url)
+    # 호출하는 쪽에서 항목을 제자리 변경하므로 항목 단위로 복사해서 반환
+    return [dict(item) for item in items]
+
+
+def _cache_ttl(final_url: str, items: list[dict[str, Any]]) -> int:
+    """
+    응답의 메모리 캐시 유지 시간(초)을 반환합니다.
+    긴 TTL은 지난 사업연도의 데이터가 있는 응답에만 사용합니다. 진행 중인 사업연도의 보고서나
+    데이터가 없는 응답(013)은 보고서가 새로 제출될 수 있으므로 짧은 TTL을 사용합니다.
+    """
+    settings = get_settings()
+    if items and disk_cache._is_closed_period(final_url):
+        return settings.DART_CACHE_TTL
+    return settings.DART_OPEN_PERIOD_CACHE_TTL
+
+
+def _set_cached_response(final_url: str, items: list[dict[str, Any]]) -> None:
+    """응답 리스트의 복사본을 사업연도에 따른 TTL과 함께 캐시에 저장합니다."""
+    settings = get_settings()
+    ttl = _cache_ttl(final_url, items)
+    if ttl <= 0:
+        return
+    if len(_response_cache) >= settings.DART_CACHE_MAXSIZE:
+        # 가장 오래 사용되지 않은 항목 제거
+        _response_cache.pop(next(iter(_response_cache)))
+    _response_cache[final_url] = (
+        time.monotonic() + ttl,
+        [dict(item) for item in items],
+    )
+
+
 async def _call_regular_report_api_template(
     final_url: str,
     api_name_for_logging: str,
@@ -32,51 +114,214 @@ async def _call_regular_report_api_template(
     Returns:
         list[dict[str, Any]]: API 응답의 'list' 항목 또는 에러/데이터 없음 시 빈 리스트.
     """
+    cached = _get_cached_response(final_url)
+    if cached is not None:
+        logger.info(
+            "DART API '%s' served from cache for corp_code: %s",
+            api_name_for_logging,
+            corp_code_for_logging,
+        )
+        return cached
+
+    task = _inflight.get(final_url)
+    if task is None:
+        task = asyncio.ensure_future(
+            _fetch_regular_report(
+                final_url, api_name_for_logging, corp_code_for_logging
+            )
+        )
+        _inflight[final_url] = task
+        task.add_done_callback(lambda _: _inflight.pop(final_url, None))
+    else:
+        logger.info(
+            "DART API '%s' joined in-flight request for corp_code: %s",
+            api_name_for_logging,
+            corp_code_for_logging,
+        )
+    # 한 호출자가 취소되어도 다른 대기자를 위해 요청은 계속 진행
+    items = await asyncio.shield(task)
+    # 호출하는 쪽에서 항목을 제자리 변경하므로 호출자마다 복사본을 반환
+    return [dict(item) for item in items]
+
+
+async def _fetch_regular_report(
+    final_url: str,
+    api_name_for_logging: str,
+    corp_code_for_logging: str,
+) -> list[dict[str, Any]]:
+    """
+    DART API를 실제로 호출하고, 정상 응답/데이터 없음 결과를 캐시에 저장합니다.
+    지난 사업연도 응답은 디스크 캐시에서 먼저 찾고, 정상 응답을 디스크에도 저장합니다.
+    """
+    stored = await disk_cache.load_response(final_url)
+    if stored is not None:
+        logger.info(
+            "DART API '%s' served from disk cache for corp_code: %s",
+            api_name_for_logging,
+            corp_code_for_logging,
+        )
+        _set_cached_response(final_url, stored)
+        return stored
+
     logger.info(
-        f"Requesting DART API '{api_name_for_logging}' from URL: {final_url} for corp_code: {corp_code_for_logging}"
+        "Requesting DART API '%s' from URL: %s for corp_code: %s",
+        api_name_for_logging,
+        final_url,
+        corp_code_for_logging,
     )
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(final_url)
-            response.raise_for_status()  # HTTP 4xx or 5xx 응답에 대해 예외 발생
-
-            data = response.json()
+        data = await request_json(final_url)
+        if logger.isEnabledFor(logging.DEBUG):  # 큰 응답의 repr 비용을 피하기 위함
             logger.debug(
-                f"DART API '{api_name_for_logging}' Raw Response for {corp_code_for_logging}: {data}"
+                "DART API '%s' Raw Response for %s: %s",
+                api_name_for_logging,
+                corp_code_for_logging,
+                data,
             )
 
-            status_code = data.get("status")
-            message = data.get("message")
-
-            if status_code == "000":
-                logger.info(
-                    f"DART API '{api_name_for_logging}' Call Successful for {corp_code_for_logging}: {message}"
-                )
-                # 반환값 작업 필요 (이 주석은 이 함수를 사용하는 각 모듈 함수 내에 있어야 합니다.)
-                return data.get("list", [])
-            elif status_code == "013":  # 데이터가 없는 경우
-                logger.info(
-                    f"DART API '{api_name_for_logging}': No data found for {corp_code_for_logging}. Message: {message}"
-                )
-                return []
-            else:  # 그 외 API 자체 에러 (status != "000" and status != "013")
-                logger.error(
-                    f"DART API '{api_name_for_logging}' Error for {corp_code_for_logging}: status={status_code}, message={message}"
-                )
-                return []
+        status_code = data.get("status")
+        message = data.get("message")
+
+        if status_code == "000":
+            logger.info(
+                "DART API '%s' Call Successful for %s: %s",
+                api_name_for_logging,
+                corp_code_for_logging,
+                message,
+            )
+            # 반환값 작업 필요 (이 주석은 이 함수를 사용하는 각 모듈 함수 내에 있어야 합니다.)
+            result = data.get("list", [])
+            _set_cached_response(final_url, result)
+            await disk_cache.save_response(final_url, result)
+            return result
+        elif status_code == "013":  # 데이터가 없는 경우
+            logger.info(
+                "DART API '%s': No data found for %s. Message: %s",
+                api_name_for_logging,
+                corp_code_for_logging,
+                message,
+            )
+            _set_cached_response(final_url, [])
+            return []
+        else:  # 그 외 API 자체 에러 (status != "000" and status != "013")
+            logger.error(
+                "DART API '%s' Error for %s: status=%s, message=%s",
+                api_name_for_logging,
+                corp_code_for_logging,
+                status_code,
+                message,
+            )
+            return []
 
     except httpx.HTTPStatusError as e:
         logger.error(
-            f"HTTP error occurred while requesting DART API '{api_name_for_logging}' for {corp_code_for_logging} from {final_url}: {e!r}"
+            "HTTP error occurred while requesting DART API '%s' for %s from %s: %r",
+            api_name_for_logging,
+            corp_code_for_logging,
+            final_url,
+            e,
         )
         return []
     except httpx.RequestError as e:  # 네트워크 문제 등 요청 관련 예외
         logger.error(
-            f"Request error occurred while requesting DART API '{api_name_for_logging}' for {corp_code_for_logging} from {final_url}: {e!r}"
+            "Request error occurred while requesting DART API '%s' for %s from %s: %r",
+            api_name_for_logging,
+            corp_code_for_logging,
+            final_url,
+            e,
         )
         return []
-    except Exception as e:  # JSON 파싱 오류 등 기타 예외
-        logger.error(
-            f"An unexpected error occurred while processing DART API '{api_name_for_logging}' response for {corp_code_for_logging} from {final_url}: {e!r}"
+    except orjson.JSONDecodeError as e:  # 응답 본문이 JSON이 아닌 경우
+        logger.warning(
+            "Invalid JSON in DART API '%s' response for %s from %s: %r",
+            api_name_for_logging,
+            corp_code_for_logging,
+            final_url,
+            e,
         )
         return []
+
+
+async def gather_endpoint_results(
+    *coros: Coroutine[Any, Any, list[dict[str, Any]]],
+    corp_code_for_logging: str,
+) -> tuple[list[dict[str, Any]], ...]:
+    """
+    여러 엔드포인트 호출 코루틴을 동시에 실행하고 결과를 전달한 순서대로 반환합니다.
+
+    한 엔드포인트에서 예외가 발생해도 나머지 요청은 취소되지 않으며,
+    실패한 엔드포인트는 오류 로그를 남기고 결과를 빈 리스트로 대체합니다.
+    """
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    for coro, result in zip(coros, results):
+        if isinstance(result, BaseException):
+            logger.error(
+                "DART API '%s' failed for %s: %r",
+                coro.__name__,
+                corp_code_for_logging,
+                result,
+            )
+    return tuple(
+        [] if isinstance(result, BaseException) else result for result in results
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointSpec:
+    """
+    엔드포인트 응답 항목의 후처리 명세.
+
+    Attributes:
+        drop: 결과에서 제거할 원본 필드.
+        add: (추가할 필드명, 원본 필드명, 매핑 함수) 목록. 원본 필드 값을 매핑 함수로 변환해 추가합니다.
+    """
+
+    drop: frozenset[str]
+    add: tuple[tuple[str, str, Callable[[Any], str]], ...] = ()
+
+
+def process_items(
+    raw_list: list[dict[str, Any]], spec: EndpointSpec
+) -> list[dict[str, Any]]:
+    """
+    `spec`에 따라 각 항목에 매핑된 필드를 추가하고 필드를 제거한 뒤 같은 리스트를 반환합니다.
+
+    항목을 제자리에서 변경하므로 호출자가 소유한 리스트만 전달해야 합니다.
+    (`_call_regular_report_api_template`은 호출자마다 복사본을 반환합니다.)
+    """
+    # 매핑 후 제거할 원본 필드는 get + pop 대신 pop 한 번으로 읽으면서 제거
+    # (같은 원본 필드를 여러 번 매핑하면 get으로 읽고 마지막에 제거)
+    src_counts = Counter(src_key for _, src_key, _ in spec.add)
+    fused = {key for key in spec.drop if src_counts[key] == 1}
+    add = [
+        (new_key, src_key, fn, src_key in fused) for new_key, src_key, fn in spec.add
+    ]
+    drop = [key for key in spec.drop if key not in fused]
+    # map()과 항목별 함수 호출은 이 루프보다 느려서 평범한 for 루프를 유지
+    for item in raw_list:
+        for new_key, src_key, fn, pop_src in add:
+            item[new_key] = fn(
+                item.pop(src_key, None) if pop_src else item.get(src_key)
+            )
+        for key in drop:
+            item.pop(key, None)
+    return raw_list
+
+
+def select_fields(item: dict[str, Any], keep: tuple[str, ...]) -> dict[str, Any]:
+    """
+    `keep`에 명시된 필드만 남긴 새 딕셔너리를 반환합니다.
+    응답에 없는 필드는 None으로 채우지 않고 결과에서 생략합니다.
+    """
+    return {key: item[key] for key in keep if key in item}
+
+
+def drop_empty_fields(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    각 항목에서 값이 없는(None 또는 빈 문자열) 필드를 제거하고 같은 리스트를 반환합니다. (제자리 변경)
+    "-"는 "해당 없음"으로 보고된 값이므로 필드가 없는 경우와 구분하기 위해 남깁니다.
+    """
+    for item in items:
+        for key in [k for k, v in item.items() if v is None or v == ""]:
+            del item[key]
+    return items
@@ -0,0 +1,123 @@
+# 설계 방향 및 원칙:
+# - 핵심 책임: 지난 사업연도의 DART 정기보고서 응답을 SQLite 테이블에 저장해, 프로세스가 재시작되어도 다시 요청하지 않도록 합니다.
+# - 설계 원칙: SRP (단일 책임 원칙) - 응답의 저장/조회만 책임지며, 메모리 캐시와 API 호출은 dart 모듈에서 처리합니다.
+# - 기술적 고려사항: 사업연도가 지난 보고서는 거의 바뀌지 않으므로 DART_DISK_CACHE_TTL 동안 유지하고,
+# 진행 중인 사업연도나 데이터가 없는 응답은 저장하지 않습니다. (메모리 캐시만 사용)
+# 응답은 orjson 바이트로 저장하며, 만료 시각은 재시작 후에도 비교할 수 있도록 벽시계 시간(time.time)을 사용합니다.
+# SQLite 작업은 블로킹이므로 `asyncio.to_thread`로 실행하고, 공유 SQLiteDB 인스턴스(get_db)는 연결을
+# 인스턴스에 보관해 여러 스레드에서 동시에 쓸 수 없으므로 작업 스레드마다 전용 연결을 하나씩 열어 재사용합니다.
+# (조회마다 연결과 PRAGMA 설정을 반복하지 않음, 오류가 난 연결은 닫고 다음 작업에서 다시 연결)
+# - 사용 시 고려사항: 캐시는 최선 노력(best effort)으로 동작하며, DB 오류는 경고 로그만 남기고 캐시 미스로 처리합니다.
+
+import asyncio
+import contextlib
+import datetime
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import orjson
+
+from dart_mcp.db.schema import DartResponseCache
+from dart_mcp.db.sqlite import SQLiteDB
+from dart_mcp.settings.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_table_ready = False
+# 작업 스레드별 캐시 DB 연결 (sqlite3 연결은 기본적으로 만든 스레드에서만 사용할 수 있음)
+_local = threading.local()
+
+
+def _is_closed_period(final_url: str) -> bool:
+    """요청 URL의 사업연도(bsns_year)가 올해 이전인지 확인합니다."""
+    bsns_year = parse_qs(urlsplit(final_url).query).get("bsns_year", [""])[0]
+    return bsns_year.isdigit() and int(bsns_year) < datetime.date.today().year
+
+
+def _ensure_table(db: SQLiteDB) -> None:
+    """캐시 테이블을 (없으면) 만들고 만료된 응답을 정리합니다. (프로세스당 한 번)"""
+    global _table_ready
+    if _table_ready:
+        return
+    db.create_table(
+        table_name=DartResponseCache.table_name(),
+        columns_schema=DartResponseCache.SCHEMA,
+    )
+    db.execute_sql(
+        f"DELETE FROM {DartResponseCache.table_name()} WHERE expires_at < ?",
+        (time.time(),),
+    )
+    _table_ready = True
+
+
+@contextlib.contextmanager
+def _connection() -> Iterator[SQLiteDB]:
+    """
+    현재 작업 스레드의 캐시 DB 연결을 제공하고, 블록이 끝나면 변경사항을 커밋합니다.
+    오류가 발생하면 연결을 닫아(커밋하지 않은 변경은 롤백) 다음 작업에서 새로 연결합니다.
+    """
+    db: SQLiteDB | None = getattr(_local, "db", None)
+    if db is None:
+        db = _local.db = SQLiteDB(db_path=get_settings().DB_PATH).connect()
+    try:
+        yield db
+        if db.conn.in_transaction:
+            db.commit()
+    except sqlite3.Error:
+        _local.db = None
+        db.conn.close()
+        raise
+
+
+def _load(final_url: str) -> list[dict[str, Any]] | None:
+    with _connection() as db:
+        _ensure_table(db)
+        row = db.fetch_one(
+            f"SELECT expires_at, body FROM {DartResponseCache.table_name()} WHERE url = ?",
+            (final_url,),
+        )
+    if row is None or row["expires_at"] < time.time():
+        return None
+    return orjson.loads(row["body"])
+
+
+def _save(final_url: str, items: list[dict[str, Any]], ttl: int) -> None:
+    with _connection() as db:
+        _ensure_table(db)
+        db.execute_sql(
+            f"INSERT OR REPLACE INTO {DartResponseCache.table_name()} "
+            "(url, expires_at, body) VALUES (?, ?, ?)",
+            (final_url, time.time() + ttl, orjson.dumps(items)),
+        )
+
+
+async def load_response(final_url: str) -> list[dict[str, Any]] | None:
+    """
+    디스크에 저장된 지난 사업연도 응답을 반환합니다.
+
+    Returns:
+        list[dict[str, Any]] | None: 저장된 응답 리스트. 대상이 아니거나 없거나 만료되었으면 None.
+    """
+    if get_settings().DART_DISK_CACHE_TTL <= 0 or not _is_closed_period(final_url):
+        return None
+    try:
+        return await asyncio.to_thread(_load, final_url)
+    except (sqlite3.Error, orjson.JSONDecodeError) as e:
+        logger.warning("Failed to read DART response cache for %s: %r", final_url, e)
+        return None
+
+
+async def save_response(final_url: str, items: list[dict[str, Any]]) -> None:
+    """지난 사업연도의 비어 있지 않은 응답을 디스크에 저장합니다."""
+    ttl = get_settings().DART_DISK_CACHE_TTL
+    if ttl <= 0 or not items or not _is_closed_period(final_url):
+        return
+    try:
+        await asyncio.to_thread(_save, final_url, items, ttl)
+    except sqlite3.Error as e:
+        logger.warning("Failed to write DART response cache for %s: %r", final_url, e)
@@ -0,0 +1,159 @@
+# 설계 방향 및 원칙:
+# - 핵심 책임: DART API 호출에 공유되는 httpx.AsyncClient의 생성과 정리를 담당합니다.
+# - 설계 원칙: SRP (단일 책임 원칙) - HTTP 연결 관리만 책임지며, 응답 처리는 각 호출부에서 수행합니다.
+# - 기술적 고려사항: 매 호출마다 TCP/TLS 연결을 새로 맺지 않도록 모듈 단위의 AsyncClient 하나를 공유합니다.
+# HTTP/2를 사용해 동시 요청을 하나의 연결 위에서 다중화하며, 서버가 지원하지 않으면 HTTP/1.1 keep-alive로 동작합니다.
+# 클라이언트에 base_url과 인증키(crtfc_key)를 추가하는 Auth를 설정하므로, 호출부는 상대 경로 URL만 전달합니다.
+# (클라이언트 params는 httpx 0.28부터 URL의 쿼리 문자열을 대체하므로 Auth에서 병합합니다.)
+# 응답 JSON은 표준 json 모듈 대신 `_decode`(orjson)로 바이트에서 바로 파싱합니다.
+# 동시에 진행되는 DART 요청 수는 세마포어로 제한하여(DART_MAX_CONCURRENCY 설정)
+# 대량 병렬 호출 시 소켓 고갈이나 DART 측 호출 제한에 걸리지 않도록 합니다.
+# 시간 초과, 네트워크 오류, 429, 5xx 응답은 `request_json`에서 지수 백오프(지터 포함)로 재시도하며,
+# 429 응답에 Retry-After 헤더가 있으면 그 시간만큼 기다립니다. (대기 중에는 세마포어를 반납)
+# - 사용 시 고려사항: 서버 종료 시 `aclose_client()`를 호출하여 연결 풀을 정리해야 합니다. (app.py의 lifespan)
+
+import asyncio
+import logging
+import random
+from typing import Any
+
+import httpx
+import orjson
+
+from dart_mcp.settings.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_USER_AGENT = "dart-mcp/0.1.0"
+
+_client: httpx.AsyncClient | None = None
+_semaphore: asyncio.Semaphore | None = None
+
+_RETRIES = 2  # 최초 요청 이후 추가 재시도 횟수
+_BACKOFF_BASE_SECONDS = 0.25
+_RETRY_AFTER_MAX_SECONDS = 30.0
+
+
+class _DartApiKeyAuth(httpx.Auth):
+    """모든 요청의 쿼리 파라미터에 DART 인증키(crtfc_key)를 추가합니다."""
+
+    def auth_flow(self, request: httpx.Request):
+        request.url = request.url.copy_merge_params(
+            {"crtfc_key": get_settings().DART_API_KEY}
+        )
+        yield request
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    DART API 호출에 공유되는 httpx.AsyncClient를 반환합니다.
+
+    최초 호출 시(또는 이전 클라이언트가 닫힌 경우) 클라이언트를 생성하며,
+    이후 호출에서는 동일한 연결 풀을 재사용합니다.
+
+    Returns:
+        httpx.AsyncClient: 공유 비동기 HTTP 클라이언트.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=get_settings().BASE_URL,
+            auth=_DartApiKeyAuth(),
+            headers={"User-Agent": _USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+            http2=True,
+            timeout=httpx.Timeout(connect=3.0, read=10.0, write=5.0, pool=5.0),
+        )
+    return _client
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """동시 요청 수를 제한하는 세마포어를 반환합니다. (최초 사용 시 설정값으로 생성)"""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(get_settings().DART_MAX_CONCURRENCY)
+    return _semaphore
+
+
+async def aclose_client() -> None:
+    """공유 httpx.AsyncClient의 연결 풀을 닫습니다. (서버 종료 시 호출)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _decode(content: bytes) -> Any:
+    """응답 본문(UTF-8 JSON 바이트)을 orjson으로 파싱합니다."""
+    return orjson.loads(content)
+
+
+def _is_retriable(exc: httpx.HTTPError) -> bool:
+    """
+    시간 초과, 네트워크 오류, 429 또는 5xx 응답처럼 재시도로 회복될 수 있는 오류인지 판단합니다.
+    지원하지 않는 프로토콜이나 프록시 오류 같은 그 외 전송 오류는 재시도해도 같으므로 제외합니다.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+        return status_code == 429 or status_code >= 500
+    return isinstance(exc, (httpx.TimeoutException, httpx.NetworkError))
+
+
+def _retry_delay(exc: httpx.HTTPError, attempt: int, base: float) -> float:
+    """재시도 전 대기 시간을 계산합니다. 429의 Retry-After(초)가 있으면 우선합니다."""
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429:
+        retry_after = exc.response.headers.get("retry-after")
+        try:
+            return min(float(retry_after), _RETRY_AFTER_MAX_SECONDS)
+        except (TypeError, ValueError):  # 헤더가 없거나 HTTP-date 형식인 경우
+            pass
+    return base * 2**attempt + random.uniform(0, base)
+
+
+async def request_json(
+    url: str, *, retries: int = _RETRIES, base: float = _BACKOFF_BASE_SECONDS
+) -> Any:
+    """
+    공유 클라이언트로 GET 요청을 보내고 응답 JSON을 파싱하여 반환합니다.
+    동시 요청 수는 세마포어로 제한되며, 일시적인 오류는 재시도합니다.
+
+    Args:
+        url (str): 요청 URL. (base_url 기준 상대 경로, 인증키는 클라이언트가 추가)
+        retries (int): 일시적인 오류(시간 초과, 네트워크 오류, 429, 5xx)에 대한 최대 재시도 횟수.
+        base (float): 지수 백오프의 기준 대기 시간(초).
+
+    Returns:
+        Any: 파싱된 응답 JSON.
+
+    Raises:
+        httpx.HTTPStatusError: 4xx 응답 또는 재시도 후에도 429/5xx 응답인 경우.
+        httpx.TransportError: 재시도 후에도 시간 초과/네트워크 오류가 계속되거나,
+            재시도 대상이 아닌 전송 오류(프로토콜, 프록시 오류 등)인 경우.
+        orjson.JSONDecodeError: 응답 본문이 JSON이 아닌 경우.
+    """
+    attempt = 0
+    while True:
+        try:
+            async with _get_semaphore():
+                response = await get_client().get(url)
+            response.raise_for_status()  # HTTP 4xx or 5xx 응답에 대해 예외 발생
+        except httpx.HTTPError as e:
+            if attempt >= retries or not _is_retriable(e):
+                raise
+            delay = _retry_delay(e, attempt, base)
+            attempt += 1
+            logger.warning(
+                "Retrying DART request (%s/%s) in %.2fs after %r: %s",
+                attempt,
+                retries,
+                delay,
+                e,
+                url,
+            )
+            await asyncio.sleep(delay)
+            continue
+        return _decode(response.content)
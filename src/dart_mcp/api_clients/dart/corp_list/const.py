@@ -1,10 +1,2 @@
-from enum import Enum
-
-from dart_mcp.settings.config import Settings
-
-BASE_URL = Settings.BASE_URL
-API_KEY = Settings.DART_API_KEY
-
-
-class urls(Enum):
-    FETCH_COMPANY_LIST: str = f"{BASE_URL}/corpCode.xml?crtfc_key={API_KEY}"
+# base_url 기준 상대 경로 (인증키는 공유 클라이언트가 추가)
+FETCH_COMPANY_LIST = "corpCode.xml"
@@ -1,30 +1,100 @@
-from io import BytesIO
+import asyncio
+import tempfile
+from typing import IO, Any
 from zipfile import ZipFile
 
-import httpx
-import xmltodict
+from lxml import etree
 
-from .const import urls
+from dart_mcp.api_clients.base.http import get_client
 
+from .const import FETCH_COMPANY_LIST
 
-def get_corp_list():
+# 다운로드한 ZIP은 이 크기까지 메모리에 두고, 넘으면 임시 파일로 옮깁니다.
+_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _parse_corp_list(xml_file: IO[bytes]) -> list[dict[str, Any]]:
+    """
+    CORPCODE.xml을 `<list>` 요소 단위로 스트리밍 파싱합니다.
+
+    처리한 요소는 즉시 비워 전체 XML 트리를 메모리에 올리지 않습니다.
+    값이 비어 있는 필드(예: 비상장사의 stock_code)는 None으로 변환합니다.
+    """
+    companies = []
+    for _, elem in etree.iterparse(xml_file, tag="list"):
+        companies.append(
+            {child.tag: (child.text or "").strip() or None for child in elem}
+        )
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+    return companies
+
+
+def _parse_corp_code_zip(zip_buffer: IO[bytes]) -> list[dict[str, Any]]:
+    """
+    CORPCODE.zip 내부의 CORPCODE.xml을 열어 기업 목록으로 변환합니다.
+    XML은 압축을 풀면서 iterparse로 스트리밍 파싱합니다.
+    """
+    with ZipFile(zip_buffer) as zip_file:
+        if "CORPCODE.xml" not in zip_file.namelist():
+            raise FileNotFoundError("Could not find company list file.")
+
+        with zip_file.open("CORPCODE.xml") as f:
+            return _parse_corp_list(f)
+
+
+_VALIDATOR_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+
+async def get_corp_list(
+    cache_headers: dict[str, str] | None = None,
+) -> tuple[list[dict[str, Any]] | None, dict[str, str]]:
     """
     DART에 등록된 기업 목록을 가져옵니다.
+
+    ZIP 파일은 공유 AsyncClient로 스트리밍 다운로드하여 SpooledTemporaryFile에 기록하며
+    (응답 본문 전체를 별도의 bytes로 복사하지 않음),
+    압축 해제 및 XML 파싱은 이벤트 루프를 막지 않도록 별도 스레드에서 수행합니다.
+    이전 응답의 ETag/Last-Modified를 전달하면 조건부 요청을 보내며,
+    서버가 304(Not Modified)로 응답하면 다운로드와 파싱을 생략합니다.
+
+    Args:
+        cache_headers (dict[str, str] | None): 이전 응답의 검증자.
+            예: {"ETag": "...", "Last-Modified": "..."}
+
+    Returns:
+        tuple[list[dict[str, Any]] | None, dict[str, str]]:
+            (기업 목록 또는 변경 없음 시 None, 이번 응답의 검증자)
     """
 
-    URL = urls.FETCH_COMPANY_LIST.value
+    cache_headers = cache_headers or {}
+
+    request_headers = {
+        request_header: cache_headers[response_header]
+        for response_header, request_header in _VALIDATOR_HEADERS.items()
+        if cache_headers.get(response_header)
+    }
 
-    with httpx.Client() as client:
-        response = client.get(URL)
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as buffer:
+        async with get_client().stream(
+            "GET", FETCH_COMPANY_LIST, headers=request_headers
+        ) as response:
+            if response.status_code == 304:
+                return None, cache_headers
 
-        if response.status_code != 200:
-            raise Exception(f"API 요청 실패: 상태 코드 {response.status_code}")
+            if response.status_code != 200:
+                raise Exception(f"API 요청 실패: 상태 코드 {response.status_code}")
 
-        with ZipFile(BytesIO(response.content)) as zip_file:
-            if "CORPCODE.xml" not in zip_file.namelist():
-                    raise FileNotFoundError("Could not find company list file.")
+            validators = {
+                header: response.headers[header]
+                for header in _VALIDATOR_HEADERS
+                if header in response.headers
+            }
 
-            with zip_file.open("CORPCODE.xml") as f:
-                parsed = xmltodict.parse(f.read())
+            async for chunk in response.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                buffer.write(chunk)
 
-            return parsed["result"]["list"]
\ No newline at end of file
+        buffer.seek(0)
+        return await asyncio.to_thread(_parse_corp_code_zip, buffer), validators
@@ -1,4 +1,5 @@
 from .module import (
+    get_all_debt_info,
     get_commercial_paper_outstanding_balance,
     get_contingent_capital_securities_outstanding_balance,
     get_corporate_bonds_outstanding_balance,
@@ -8,6 +9,7 @@ from .module import (
 )
 
 __all__ = [
+    "get_all_debt_info",
     "get_debt_securities_issuance_status",
     "get_commercial_paper_outstanding_balance",
     "get_short_term_bonds_outstanding_balance",
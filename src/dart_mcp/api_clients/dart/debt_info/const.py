@@ -1,22 +1,21 @@
-from enum import Enum
+from dart_mcp.api_clients.base.dart import report_url_builder
 
-from dart_mcp.settings.config import Settings
+build_debt_securities_issuance_status_url = report_url_builder("detScritsIsuAcmslt")
 
-BASE_URL = Settings.BASE_URL
-API_KEY = Settings.DART_API_KEY
+build_commercial_paper_outstanding_balance_url = report_url_builder(
+    "entrprsBilScritsNrdmpBlce"
+)
 
+build_short_term_bonds_outstanding_balance_url = report_url_builder(
+    "srtpdPsndbtNrdmpBlce"
+)
 
-class urls(Enum):
-    """DART API 엔드포인트 URL 템플릿을 정의하는 Enum 클래스입니다."""
+build_corporate_bonds_outstanding_balance_url = report_url_builder("cprndNrdmpBlce")
 
-    GET_DEBT_SECURITIES_ISSUANCE_STATUS: str = f"{BASE_URL}/detScritsIsuAcmslt.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}"
+build_hybrid_securities_outstanding_balance_url = report_url_builder(
+    "newCaplScritsNrdmpBlce"
+)
 
-    GET_COMMERCIAL_PAPER_OUTSTANDING_BALANCE: str = f"{BASE_URL}/entrprsBilScritsNrdmpBlce.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}"
-
-    GET_SHORT_TERM_BONDS_OUTSTANDING_BALANCE: str = f"{BASE_URL}/srtpdPsndbtNrdmpBlce.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}"
-
-    GET_CORPORATE_BONDS_OUTSTANDING_BALANCE: str = f"{BASE_URL}/cprndNrdmpBlce.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}"
-
-    GET_HYBRID_SECURITIES_OUTSTANDING_BALANCE: str = f"{BASE_URL}/newCaplScritsNrdmpBlce.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}"
-
-    GET_CONTINGENT_CAPITAL_SECURITIES_OUTSTANDING_BALANCE: str = f"{BASE_URL}/cndlCaplScritsNrdmpBlce.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}"
+build_contingent_capital_securities_outstanding_balance_url = report_url_builder(
+    "cndlCaplScritsNrdmpBlce"
+)
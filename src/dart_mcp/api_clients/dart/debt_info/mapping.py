@@ -21,7 +21,10 @@ class CorpClassMapping(Enum):
     @classmethod
     def get_korean_name(cls, code: str) -> str:
         """주어진 법인구분 코드에 해당하는 한글 명칭을 반환합니다."""
-        for member in cls:
-            if member.value[0] == code:
-                return member.value[1]
-        return cls.UNKNOWN.value[1]  # 매칭되는 코드가 없을 경우 기본값 반환
+        # 매칭되는 코드가 없을 경우 기본값 반환
+        return _CORP_CLS_MAP.get(code, _UNKNOWN)
+
+
+# 코드 -> 한글 명칭 조회 테이블 (import 시 한 번만 생성)
+_CORP_CLS_MAP = {member.value[0]: member.value[1] for member in CorpClassMapping}
+_UNKNOWN = CorpClassMapping.UNKNOWN.value[1]
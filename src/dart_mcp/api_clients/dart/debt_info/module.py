@@ -12,13 +12,132 @@
 import logging
 from typing import Any
 
-from dart_mcp.api_clients.base.dart import _call_regular_report_api_template
-
-from .const import urls
+from dart_mcp.api_clients.base.dart import (
+    _call_regular_report_api_template,
+    gather_endpoint_results,
+    select_fields,
+)
+
+from .const import (
+    build_commercial_paper_outstanding_balance_url,
+    build_contingent_capital_securities_outstanding_balance_url,
+    build_corporate_bonds_outstanding_balance_url,
+    build_debt_securities_issuance_status_url,
+    build_hybrid_securities_outstanding_balance_url,
+    build_short_term_bonds_outstanding_balance_url,
+)
 from .mapping import CorpClassMapping
 
 logger = logging.getLogger(__name__)
 
+_get_korean = CorpClassMapping.get_korean_name
+
+# 엔드포인트별로 응답에서 유지할 필드 (docstring의 반환 키 목록과 동일, corp_cls_nm 제외)
+_DEBT_SECURITIES_ISSUANCE_KEYS = (
+    "corp_name",
+    "isu_cmpny",
+    "scrits_knd_nm",
+    "isu_mth_nm",
+    "isu_de",
+    "facvalu_totamt",
+    "intrt",
+    "evl_grad_instt",
+    "mtd",
+    "repy_at",
+    "mngt_cmpny",
+    "stlm_dt",
+)
+_COMMERCIAL_PAPER_KEYS = (
+    "corp_name",
+    "remndr_exprtn1",
+    "remndr_exprtn2",
+    "de10_below",
+    "de10_excess_de30_below",
+    "de30_excess_de90_below",
+    "de90_excess_de180_below",
+    "de180_excess_yy1_below",
+    "yy1_excess_yy2_below",
+    "yy2_excess_yy3_below",
+    "yy3_excess",
+    "sm",
+    "stlm_dt",
+)
+_SHORT_TERM_BONDS_KEYS = (
+    "corp_name",
+    "remndr_exprtn1",
+    "remndr_exprtn2",
+    "de10_below",
+    "de10_excess_de30_below",
+    "de30_excess_de90_below",
+    "de90_excess_de180_below",
+    "de180_excess_yy1_below",
+    "sm",
+    "isu_lmt",
+    "remndr_lmt",
+    "stlm_dt",
+)
+_CORPORATE_BONDS_KEYS = (
+    "corp_name",
+    "remndr_exprtn1",
+    "remndr_exprtn2",
+    "yy1_below",
+    "yy1_excess_yy2_below",
+    "yy2_excess_yy3_below",
+    "yy3_excess_yy4_below",
+    "yy4_excess_yy5_below",
+    "yy5_excess_yy10_below",
+    "yy10_excess",
+    "sm",
+    "stlm_dt",
+)
+_NEW_CAPITAL_SECURITIES_KEYS = (
+    "corp_name",
+    "remndr_exprtn1",
+    "remndr_exprtn2",
+    "yy1_below",
+    "yy1_excess_yy5_below",
+    "yy5_excess_yy10_below",
+    "yy10_excess_yy15_below",
+    "yy15_excess_yy20_below",
+    "yy20_excess_yy30_below",
+    "yy30_excess",
+    "sm",
+    "stlm_dt",
+)
+_CONTINGENT_CAPITAL_SECURITIES_KEYS = (
+    "corp_name",
+    "remndr_exprtn1",
+    "remndr_exprtn2",
+    "yy1_below",
+    "yy1_excess_yy2_below",
+    "yy2_excess_yy3_below",
+    "yy3_excess_yy4_below",
+    "yy4_excess_yy5_below",
+    "yy5_excess_yy10_below",
+    "yy10_excess_yy20_below",
+    "yy20_excess_yy30_below",
+    "yy30_excess",
+    "sm",
+    "stlm_dt",
+)
+
+
+def _post_process(
+    raw_list: list[dict[str, Any]], keep: tuple[str, ...]
+) -> list[dict[str, Any]]:
+    """
+    `keep`에 명시된 필드만 남긴 새 딕셔너리를 만들고 법인구분명(corp_cls_nm)을 추가합니다.
+    응답에 예상하지 못한 필드가 추가되더라도 결과에 포함되지 않으며, 응답에 없는 필드는 생략합니다.
+    """
+    get_cls = _get_korean  # 항목마다 전역 이름 조회를 하지 않도록 지역 변수로 바인딩
+    result: list[dict[str, Any]] = []
+    append = result.append
+    for item in raw_list:
+        row = select_fields(item, keep)
+        row["corp_cls_nm"] = get_cls(item.get("corp_cls"))
+        append(row)
+    return result
+
 
 async def get_debt_securities_issuance_status(
     corp_code: str, bsns_year: str, reprt_code: str
@@ -48,22 +167,13 @@ async def get_debt_securities_issuance_status(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_DEBT_SECURITIES_ISSUANCE_STATUS.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_debt_securities_issuance_status_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_debt_securities_issuance_status",
         corp_code_for_logging=corp_code,
     )
-
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return _post_process(raw_list, _DEBT_SECURITIES_ISSUANCE_KEYS)
 
 
 async def get_commercial_paper_outstanding_balance(
@@ -95,22 +205,13 @@ async def get_commercial_paper_outstanding_balance(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_COMMERCIAL_PAPER_OUTSTANDING_BALANCE.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_commercial_paper_outstanding_balance_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_commercial_paper_outstanding_balance",
         corp_code_for_logging=corp_code,
     )
-
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return _post_process(raw_list, _COMMERCIAL_PAPER_KEYS)
 
 
 async def get_short_term_bonds_outstanding_balance(
@@ -141,22 +242,13 @@ async def get_short_term_bonds_outstanding_balance(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_SHORT_TERM_BONDS_OUTSTANDING_BALANCE.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_short_term_bonds_outstanding_balance_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_short_term_bonds_outstanding_balance",
         corp_code_for_logging=corp_code,
     )
-
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return _post_process(raw_list, _SHORT_TERM_BONDS_KEYS)
 
 
 async def get_corporate_bonds_outstanding_balance(
@@ -187,22 +279,13 @@ async def get_corporate_bonds_outstanding_balance(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_CORPORATE_BONDS_OUTSTANDING_BALANCE.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_corporate_bonds_outstanding_balance_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_corporate_bonds_outstanding_balance",
         corp_code_for_logging=corp_code,
     )
-
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return _post_process(raw_list, _CORPORATE_BONDS_KEYS)
 
 
 async def get_new_capital_securities_outstanding_balance(
@@ -233,22 +316,13 @@ async def get_new_capital_securities_outstanding_balance(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_HYBRID_SECURITIES_OUTSTANDING_BALANCE.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_hybrid_securities_outstanding_balance_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_hybrid_securities_outstanding_balance",
         corp_code_for_logging=corp_code,
     )
-
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return _post_process(raw_list, _NEW_CAPITAL_SECURITIES_KEYS)
 
 
 async def get_contingent_capital_securities_outstanding_balance(
@@ -281,19 +355,43 @@ async def get_contingent_capital_securities_outstanding_balance(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_CONTINGENT_CAPITAL_SECURITIES_OUTSTANDING_BALANCE.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_contingent_capital_securities_outstanding_balance_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_contingent_capital_securities_outstanding_balance",
         corp_code_for_logging=corp_code,
     )
+    return _post_process(raw_list, _CONTINGENT_CAPITAL_SECURITIES_KEYS)
+
+
+async def get_all_debt_info(
+    corp_code: str, bsns_year: str, reprt_code: str
+) -> tuple[list[dict[str, Any]], ...]:
+    """채무 관련 6개 API를 동시에 호출합니다.
 
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    한 API에서 예외가 발생해도 나머지 요청은 취소되지 않으며,
+    실패한 API의 결과는 빈 리스트로 대체됩니다.
+
+    Args:
+        corp_code (str): 공시대상회사의 고유번호(8자리).
+        bsns_year (str): 사업연도(4자리).
+        reprt_code (str): 보고서 코드 (1분기: 11013, 반기: 11012, 3분기: 11014, 사업: 11011).
+
+    Returns:
+        tuple[list[dict[str, Any]], ...]: 다음 순서의 결과 리스트 튜플.
+            (회사채 미상환 잔액, 기업어음증권 미상환 잔액, 조건부자본증권 미상환 잔액,
+             신종자본증권 미상환 잔액, 단기사채 미상환 잔액, 채무증권 발행실적)
+    """
+    return await gather_endpoint_results(
+        get_corporate_bonds_outstanding_balance(corp_code, bsns_year, reprt_code),
+        get_commercial_paper_outstanding_balance(corp_code, bsns_year, reprt_code),
+        get_contingent_capital_securities_outstanding_balance(
+            corp_code, bsns_year, reprt_code
+        ),
+        get_new_capital_securities_outstanding_balance(
+            corp_code, bsns_year, reprt_code
+        ),
+        get_short_term_bonds_outstanding_balance(corp_code, bsns_year, reprt_code),
+        get_debt_securities_issuance_status(corp_code, bsns_year, reprt_code),
+        corp_code_for_logging=corp_code,
+    )
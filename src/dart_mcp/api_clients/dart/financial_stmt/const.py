@@ -1,12 +1,10 @@
-from enum import Enum
+# URL 템플릿(base_url 기준 상대 경로, 인증키는 공유 클라이언트가 추가)은 import 시 한 번만 만들고, 요청마다 `%` 포매팅으로 파라미터만 채워 넣습니다.
+_COMPANY_FINANCIAL_STMT_TEMPLATE = (
+    "fnlttSinglAcntAll.json?corp_code=%s&bsns_year=%s&reprt_code=%s&fs_div=%s"
+)
 
-from dart_mcp.settings.config import Settings
 
-BASE_URL = Settings.BASE_URL
-API_KEY = Settings.DART_API_KEY
-
-
-class urls(Enum):
-    """DART API 엔드포인트 URL 템플릿을 정의하는 Enum 클래스입니다."""
-
-    GET_COMPANY_FINANCIAL_STMT: str = f"{BASE_URL}/fnlttSinglAcntAll.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}&fs_div={{fs_div}}"
+def build_company_financial_stmt_url(
+    corp_code: str, bsns_year: str, reprt_code: str, fs_div: str
+) -> str:
+    return _COMPANY_FINANCIAL_STMT_TEMPLATE % (corp_code, bsns_year, reprt_code, fs_div)
@@ -1,13 +1,55 @@
 import logging
 from typing import Any
 
-import httpx
+from dart_mcp.api_clients.base.dart import (
+    _call_regular_report_api_template,
+    select_fields,
+)
 
-from .const import urls
+from .const import build_company_financial_stmt_url
 from .mapping import FinancialStatementDivisionName, ReportCodeName
 
 logger = logging.getLogger(__name__)
 
+# 응답 필드 중 결과에 남길 필드 (rcept_no, reprt_code, corp_code, sj_div는 제외)
+_FINANCIAL_STMT_KEYS = (
+    "bsns_year",
+    "sj_nm",
+    "account_id",
+    "account_nm",
+    "account_detail",
+    "thstrm_nm",
+    "thstrm_amount",
+    "thstrm_add_amount",
+    "frmtrm_nm",
+    "frmtrm_amount",
+    "frmtrm_q_nm",
+    "frmtrm_q_amount",
+    "frmtrm_add_amount",
+    "bfefrmtrm_nm",
+    "bfefrmtrm_amount",
+    "ord",
+    "currency",
+)
+
+
+def _post_process(raw_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    남길 필드만으로 새 딕셔너리를 만들고 보고서명/재무제표명을 추가합니다.
+    응답에 없는 필드는 결과에도 포함하지 않습니다.
+    """
+    keys = _FINANCIAL_STMT_KEYS
+    reprt_name = ReportCodeName.get_korean_name_by_code
+    sj_div_name = FinancialStatementDivisionName.get_korean_name_by_code
+    result: list[dict[str, Any]] = []
+    append = result.append
+    for item in raw_list:
+        row = select_fields(item, keys)
+        row["reprt_name_kr"] = reprt_name(item.get("reprt_code"))
+        row["sj_div_name_kr"] = sj_div_name(item.get("sj_div"))
+        append(row)
+    return result
+
 
 async def get_financial_statement(
     corp_code: str, bsns_year: str, reprt_code: str, fs_div: str
@@ -30,67 +72,11 @@ async def get_financial_statement(
             원본 코드 필드(rcept_no, reprt_code, corp_code, sj_div)는 제거됩니다.
             API 응답이 성공적이지 않거나 데이터가 없는 경우 빈 리스트를 반환합니다.
     """
-    base_url_template = urls.GET_COMPANY_FINANCIAL_STMT.value
-
-    final_url = base_url_template.format(
-        corp_code=corp_code,
-        bsns_year=bsns_year,
-        reprt_code=reprt_code,
-        fs_div=fs_div,
+    raw_list = await _call_regular_report_api_template(
+        final_url=build_company_financial_stmt_url(
+            corp_code, bsns_year, reprt_code, fs_div
+        ),
+        api_name_for_logging="get_financial_statement",
+        corp_code_for_logging=corp_code,
     )
-
-    logger.info(f"Requesting DART financial statement from URL: {final_url}")
-
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(final_url)
-            response.raise_for_status()
-
-            data = response.json()
-            logger.debug(f"DART API Raw Response: {data}")
-
-            status_code = data.get("status")
-            message = data.get("message")
-
-            if status_code == "000":
-                logger.info(f"DART API Call Successful: {message}")
-                raw_list = data.get("list", [])
-                processed_list = []
-                keys_to_remove = ["rcept_no", "reprt_code", "corp_code", "sj_div"]
-                for item in raw_list:
-                    item["reprt_name_kr"] = ReportCodeName.get_korean_name_by_code(
-                        item.get("reprt_code")
-                    )
-                    item["sj_div_name_kr"] = (
-                        FinancialStatementDivisionName.get_korean_name_by_code(
-                            item.get("sj_div")
-                        )
-                    )
-
-                    for key_to_remove in keys_to_remove:
-                        item.pop(key_to_remove, None)
-
-                    processed_list.append(item)
-                return processed_list
-            elif status_code == "013":
-                logger.info(f"DART API: No data found. Message: {message}")
-                return []
-            else:
-                logger.error(f"DART API Error: status={status_code}, message={message}")
-                return []
-
-    except httpx.HTTPStatusError as e:
-        logger.error(
-            f"HTTP error occurred while requesting DART API for {corp_code}: {e!r}"
-        )
-        return []
-    except httpx.RequestError as e:
-        logger.error(
-            f"Request error occurred while requesting DART API for {corp_code}: {e!r}"
-        )
-        return []
-    except Exception as e:
-        logger.error(
-            f"An unexpected error occurred while processing DART API response for {corp_code}: {e!r}"
-        )
-        return []
+    return _post_process(raw_list)
@@ -1,12 +1,10 @@
-from enum import Enum
+# URL 템플릿(base_url 기준 상대 경로, 인증키는 공유 클라이언트가 추가)은 import 시 한 번만 만들고, 요청마다 `%` 포매팅으로 파라미터만 채워 넣습니다.
+_COMPANY_FINANCIAL_STMT_LIST_TEMPLATE = (
+    "list.json?corp_code=%s&bgn_de=%s&end_de=%s&pblntf_ty=A&page_count=100&sort=date"
+)
 
-from dart_mcp.settings.config import Settings
 
-BASE_URL = Settings.BASE_URL
-API_KEY = Settings.DART_API_KEY
-
-
-class urls(Enum):
-    """DART API 엔드포인트 URL 템플릿을 정의하는 Enum 클래스입니다."""
-
-    GET_COMPANY_FINANCIAL_STMT_LIST: str = f"{BASE_URL}/list.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bgn_de={{start_date}}&end_de={{end_date}}&pblntf_ty=A&page_count=100&sort=date"
+def build_company_financial_stmt_list_url(
+    corp_code: str, start_date: str, end_date: str
+) -> str:
+    return _COMPANY_FINANCIAL_STMT_LIST_TEMPLATE % (corp_code, start_date, end_date)
@@ -1,10 +1,12 @@
 from .module import (
+    get_all_investment_info,
     get_investment_in_subsidiaries,
     get_private_placement_fund_usage_details,
     get_public_offering_fund_usage_details,
 )
 
 __all__ = [
+    "get_all_investment_info",
     "get_investment_in_subsidiaries",
     "get_public_offering_fund_usage_details",
     "get_private_placement_fund_usage_details",
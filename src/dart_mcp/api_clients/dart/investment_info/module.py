@@ -11,12 +11,32 @@
 import logging
 from typing import Any
 
-from dart_mcp.api_clients.base.dart import _call_regular_report_api_template
-
-from .const import urls
+from dart_mcp.api_clients.base.dart import (
+    EndpointSpec,
+    _call_regular_report_api_template,
+    gather_endpoint_results,
+    process_items,
+)
+
+from .const import (
+    build_investment_in_subsidiaries_url,
+    build_private_placement_fund_usage_details_url,
+    build_public_offering_fund_usage_details_url,
+)
 
 logger = logging.getLogger(__name__)
 
+# 엔드포인트별 후처리 명세 (현재 투자 관련 API는 corp_cls에 대한 명시적 매핑 필요 없음)
+_BASE_DROP = frozenset({"rcept_no", "corp_code", "corp_cls"})
+_SUBSIDIARIES_SPEC = EndpointSpec(drop=_BASE_DROP)
+# 이전 버전 필드도 제거
+_PUBLIC_OFFERING_SPEC = EndpointSpec(
+    drop=_BASE_DROP | {"on_dclrt_cptal_use_plan", "real_cptal_use_sttus"}
+)
+_PRIVATE_PLACEMENT_SPEC = EndpointSpec(
+    drop=_BASE_DROP | {"cptal_use_plan", "real_cptal_use_sttus"}
+)
+
 
 async def get_investment_in_subsidiaries(
     corp_code: str, bsns_year: str, reprt_code: str
@@ -50,22 +70,14 @@ async def get_investment_in_subsidiaries(
             - stlm_dt (str): 결산기준일 (YYYY-MM-DD)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_INVESTMENT_IN_SUBSIDIARIES.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_investment_in_subsidiaries_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_investment_in_subsidiaries",
         corp_code_for_logging=corp_code,
     )
 
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            # 현재 API에서는 corp_cls에 대한 명시적 매핑 필요 없음
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _SUBSIDIARIES_SPEC)
 
 
 async def get_public_offering_fund_usage_details(
@@ -95,27 +107,14 @@ async def get_public_offering_fund_usage_details(
             (원본 필드 rcept_no, corp_code, corp_cls는 제거됩니다.)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_PUBLIC_OFFERING_FUND_USAGE_DETAILS.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_public_offering_fund_usage_details_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_public_offering_fund_usage_details",
         corp_code_for_logging=corp_code,
     )
 
-    processed_list = []
-    keys_to_remove = [
-        "rcept_no",
-        "corp_code",
-        "corp_cls",
-        "on_dclrt_cptal_use_plan",
-        "real_cptal_use_sttus",
-    ]
-    if raw_list:
-        for item in raw_list:
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)  # 이전 버전 필드도 제거 시도
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _PUBLIC_OFFERING_SPEC)
 
 
 async def get_private_placement_fund_usage_details(
@@ -144,24 +143,36 @@ async def get_private_placement_fund_usage_details(
             - stlm_dt (str): 결산기준일 (YYYY-MM-DD)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_PRIVATE_PLACEMENT_FUND_USAGE_DETAILS.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_private_placement_fund_usage_details_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_private_placement_fund_usage_details",
         corp_code_for_logging=corp_code,
     )
 
-    processed_list = []
-    keys_to_remove = [
-        "rcept_no",
-        "corp_code",
-        "corp_cls",
-        "cptal_use_plan",
-        "real_cptal_use_sttus",
-    ]
-    if raw_list:
-        for item in raw_list:
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)  # 이전 버전 필드도 제거 시도
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _PRIVATE_PLACEMENT_SPEC)
+
+
+async def get_all_investment_info(
+    corp_code: str, bsns_year: str, reprt_code: str
+) -> tuple[list[dict[str, Any]], ...]:
+    """투자 관련 3개 API를 동시에 호출합니다.
+
+    한 API에서 예외가 발생해도 나머지 요청은 취소되지 않으며,
+    실패한 API의 결과는 빈 리스트로 대체됩니다.
+
+    Args:
+        corp_code (str): 공시대상회사의 고유번호(8자리).
+        bsns_year (str): 사업연도(4자리).
+        reprt_code (str): 보고서 코드 (1분기: 11013, 반기: 11012, 3분기: 11014, 사업: 11011).
+
+    Returns:
+        tuple[list[dict[str, Any]], ...]: 다음 순서의 결과 리스트 튜플.
+            (타법인 출자현황, 사모자금 사용내역, 공모자금 사용내역)
+    """
+    return await gather_endpoint_results(
+        get_investment_in_subsidiaries(corp_code, bsns_year, reprt_code),
+        get_private_placement_fund_usage_details(corp_code, bsns_year, reprt_code),
+        get_public_offering_fund_usage_details(corp_code, bsns_year, reprt_code),
+        corp_code_for_logging=corp_code,
+    )
@@ -1,4 +1,5 @@
 from .module import (
+    get_all_people_info,
     get_company_employees,
     get_company_excutives,
     get_individual_compensation_of_directors_and_auditors,
@@ -8,6 +9,7 @@ from .module import (
 )
 
 __all__ = [
+    "get_all_people_info",
     "get_company_excutives",
     "get_company_employees",
     "get_individual_compensation_of_directors_and_auditors",
@@ -20,12 +20,7 @@ class CorpClassMapping(Enum):
 
     @classmethod
     def get_korean_name(cls, code: str | None) -> str:
-        if code is None:
-            return cls.UNKNOWN.value[1]
-        for member in cls:
-            if member.value[0] == code:
-                return member.value[1]
-        return cls.UNKNOWN.value[1]
+        return _CORP_CLS_MAP.get(code, _UNKNOWN)
 
 
 class GenderMapping(Enum):
@@ -37,16 +32,8 @@ class GenderMapping(Enum):
 
     @classmethod
     def get_korean_name(cls, code: str | None) -> str:
-        if code is None:
-            return cls.UNKNOWN.value[1]
-        for member in cls:
-            # API 응답값이 '남', '여'로 직접 오므로 첫번째 값이 아닌 두번째 값으로 비교할 수도 있으나,
-            # 다른 매핑과의 일관성을 위해 API 응답값을 코드로 간주하고 매핑합니다.
-            # 만약 API가 항상 '남성', '여성'이 아닌 '남', '여'로만 준다면, member.value[0] == code로 비교합니다.
-            # 제공된 명세에는 '남'으로 되어있어, 코드를 '남'으로 가정합니다.
-            if member.value[0] == code:  # API 응답이 '남', '여'인 경우
-                return member.value[1]
-        return cls.UNKNOWN.value[1]
+        # 제공된 명세에는 API 응답값이 '남', '여'로 되어 있어, 이를 코드로 간주하고 매핑합니다.
+        return _GENDER_MAP.get(code, _UNKNOWN)
 
 
 class RegisteredExecutiveMapping(Enum):
@@ -60,16 +47,15 @@ class RegisteredExecutiveMapping(Enum):
     @classmethod
     def get_korean_name(cls, code: str | None) -> str:
         if code is None:
-            return cls.UNKNOWN.value[1]
-        for member in cls:
-            if member.value[0] == code:
-                return member.value[1]
+            return _UNKNOWN
+        name = _REGISTERED_EXECUTIVE_MAP.get(code)
+        if name is not None:
+            return name
         # '등'을 처리하기 위한 로직 (예: '사외이사 등'과 같이 '등'이 붙는 경우)
         if code.endswith(" 등"):
-            original_code = code[:-2]
-            for member_check in cls:
-                if member_check.value[0] == original_code:
-                    return member_check.value[1] + " 등"
+            name = _REGISTERED_EXECUTIVE_MAP.get(code[:-2])
+            if name is not None:
+                return name + " 등"
         return code  # 매핑되지 않으면 원본 반환 또는 UNKNOWN 처리
 
 
@@ -84,8 +70,17 @@ class FullTimeExecutiveMapping(Enum):
     @classmethod
     def get_korean_name(cls, code: str | None) -> str:
         if code is None:
-            return cls.UNKNOWN.value[1]
-        for member in cls:
-            if member.value[0] == code:
-                return member.value[1]
-        return code  # 매핑되지 않으면 원본 반환 또는 UNKNOWN 처리
+            return _UNKNOWN
+        return _FULL_TIME_EXECUTIVE_MAP.get(code, code)  # 매핑되지 않으면 원본 반환
+
+
+# 코드 -> 한글 명칭 조회 테이블 (import 시 한 번만 생성)
+_CORP_CLS_MAP = {member.value[0]: member.value[1] for member in CorpClassMapping}
+_GENDER_MAP = {member.value[0]: member.value[1] for member in GenderMapping}
+_REGISTERED_EXECUTIVE_MAP = {
+    member.value[0]: member.value[1] for member in RegisteredExecutiveMapping
+}
+_FULL_TIME_EXECUTIVE_MAP = {
+    member.value[0]: member.value[1] for member in FullTimeExecutiveMapping
+}
+_UNKNOWN = CorpClassMapping.UNKNOWN.value[1]
@@ -11,9 +11,21 @@
 import logging
 from typing import Any
 
-from dart_mcp.api_clients.base.dart import _call_regular_report_api_template
+from dart_mcp.api_clients.base.dart import (
+    EndpointSpec,
+    _call_regular_report_api_template,
+    gather_endpoint_results,
+    process_items,
+)
 
-from .const import urls
+from .const import (
+    build_company_employees_url,
+    build_company_excutives_url,
+    build_individual_compensation_of_directors_and_auditors_url,
+    build_individual_compensation_of_unregular_executive_officers_url,
+    build_outside_directors_info_and_chages_url,
+    build_top_five_individual_compensation_url,
+)
 from .mapping import (
     CorpClassMapping,
     FullTimeExecutiveMapping,
@@ -24,6 +36,36 @@ from .mapping import (
 logger = logging.getLogger(__name__)
 
 
+_BASE_DROP = frozenset({"rcept_no", "corp_code", "corp_cls"})
+_CORP_CLS_NM = ("corp_cls_nm", "corp_cls", CorpClassMapping.get_korean_name)
+_SEXDSTN_NM = ("sexdstn_nm", "sexdstn", GenderMapping.get_korean_name)
+
+_CORP_CLS_SPEC = EndpointSpec(drop=_BASE_DROP, add=(_CORP_CLS_NM,))
+_EXECUTIVES_SPEC = EndpointSpec(
+    drop=_BASE_DROP | {"sexdstn", "rgist_exctv_at", "fte_at"},
+    add=(
+        _CORP_CLS_NM,
+        _SEXDSTN_NM,
+        (
+            "rgist_exctv_at_nm",
+            "rgist_exctv_at",
+            RegisteredExecutiveMapping.get_korean_name,
+        ),
+        ("fte_at_nm", "fte_at", FullTimeExecutiveMapping.get_korean_name),
+    ),
+)
+_EMPLOYEES_SPEC = EndpointSpec(
+    drop=_BASE_DROP
+    | {
+        "sexdstn",
+        "reform_bfe_emp_co_rgllbr",
+        "reform_bfe_emp_co_cnttk",
+        "reform_bfe_emp_co_etc",
+    },
+    add=(_CORP_CLS_NM, _SEXDSTN_NM),
+)
+
+
 async def get_company_excutives(
     corp_code: str, bsns_year: str, reprt_code: str
 ) -> list[dict[str, Any]]:
@@ -53,37 +95,12 @@ async def get_company_excutives(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_COMPANY_EXCUTIVES.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-        ),
+        final_url=build_company_excutives_url(corp_code, bsns_year, reprt_code),
         api_name_for_logging="get_company_excutives",
         corp_code_for_logging=corp_code,
     )
 
-    processed_list = []
-    keys_to_remove = [
-        "rcept_no",
-        "corp_code",
-        "corp_cls",
-        "sexdstn",
-        "rgist_exctv_at",
-        "fte_at",
-    ]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            item["sexdstn_nm"] = GenderMapping.get_korean_name(item.get("sexdstn"))
-            item["rgist_exctv_at_nm"] = RegisteredExecutiveMapping.get_korean_name(
-                item.get("rgist_exctv_at")
-            )
-            item["fte_at_nm"] = FullTimeExecutiveMapping.get_korean_name(
-                item.get("fte_at")
-            )
-
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _EXECUTIVES_SPEC)
 
 
 async def get_company_employees(
@@ -115,31 +132,12 @@ async def get_company_employees(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_COMPANY_EMPLOYEES.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-        ),
+        final_url=build_company_employees_url(corp_code, bsns_year, reprt_code),
         api_name_for_logging="get_company_employees",
         corp_code_for_logging=corp_code,
     )
 
-    processed_list = []
-    keys_to_remove = [
-        "rcept_no",
-        "corp_code",
-        "corp_cls",
-        "sexdstn",
-        "reform_bfe_emp_co_rgllbr",
-        "reform_bfe_emp_co_cnttk",
-        "reform_bfe_emp_co_etc",
-    ]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            item["sexdstn_nm"] = GenderMapping.get_korean_name(item.get("sexdstn"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _EMPLOYEES_SPEC)
 
 
 async def get_individual_compensation_of_directors_and_auditors(
@@ -164,22 +162,14 @@ async def get_individual_compensation_of_directors_and_auditors(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_INDIVIDUAL_COMPENSATION_OF_DIRECTORS_AND_AUDITORS.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_individual_compensation_of_directors_and_auditors_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_individual_compensation_of_directors_and_auditors",
         corp_code_for_logging=corp_code,
     )
 
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _CORP_CLS_SPEC)
 
 
 async def get_individual_compensation_of_unregular_executive_officers(
@@ -205,22 +195,14 @@ async def get_individual_compensation_of_unregular_executive_officers(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_INDIVIDUAL_COMPENSATION_OF_UNREGULAR_EXECUTIVE_OFFICERS.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_individual_compensation_of_unregular_executive_officers_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_individual_compensation_of_unregular_executive_officers",
         corp_code_for_logging=corp_code,
     )
 
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _CORP_CLS_SPEC)
 
 
 async def get_outside_directors_info_and_chages(
@@ -246,22 +228,14 @@ async def get_outside_directors_info_and_chages(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_OUTSIDE_DIRECTORS_INFO_AND_CHAGES.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_outside_directors_info_and_chages_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_outside_directors_info_and_chages",
         corp_code_for_logging=corp_code,
     )
 
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _CORP_CLS_SPEC)
 
 
 async def get_top_five_individual_compensation(
@@ -286,19 +260,44 @@ async def get_top_five_individual_compensation(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_TOP_FIVE_INDIVIDUAL_COMPENSATION.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_top_five_individual_compensation_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_top_five_individual_compensation",
         corp_code_for_logging=corp_code,
     )
 
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _CORP_CLS_SPEC)
+
+
+async def get_all_people_info(
+    corp_code: str, bsns_year: str, reprt_code: str
+) -> tuple[list[dict[str, Any]], ...]:
+    """임직원/보수 관련 6개 API를 동시에 호출합니다.
+
+    한 API에서 예외가 발생해도 나머지 요청은 취소되지 않으며,
+    실패한 API의 결과는 빈 리스트로 대체됩니다.
+
+    Args:
+        corp_code (str): 공시대상회사의 고유번호(8자리).
+        bsns_year (str): 사업연도(4자리).
+        reprt_code (str): 보고서 코드 (1분기: 11013, 반기: 11012, 3분기: 11014, 사업: 11011).
+
+    Returns:
+        tuple[list[dict[str, Any]], ...]: 다음 순서의 결과 리스트 튜플.
+            (직원 현황, 임원 현황, 이사·감사 전체 보수현황, 미등기임원 보수현황,
+             사외이사 및 그 변동현황, 개인별 보수지급 금액(상위 5명))
+    """
+    return await gather_endpoint_results(
+        get_company_employees(corp_code, bsns_year, reprt_code),
+        get_company_excutives(corp_code, bsns_year, reprt_code),
+        get_individual_compensation_of_directors_and_auditors(
+            corp_code, bsns_year, reprt_code
+        ),
+        get_individual_compensation_of_unregular_executive_officers(
+            corp_code, bsns_year, reprt_code
+        ),
+        get_outside_directors_info_and_chages(corp_code, bsns_year, reprt_code),
+        get_top_five_individual_compensation(corp_code, bsns_year, reprt_code),
+        corp_code_for_logging=corp_code,
+    )
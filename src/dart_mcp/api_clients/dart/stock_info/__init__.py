@@ -1,5 +1,6 @@
 from .module import (
     get_acquisition_of_treasury_stock,
+    get_all_stock_info,
     get_capital_increase_or_decrease_status,
     get_dividend_status,
     get_largest_shareholder,
@@ -8,6 +9,7 @@ from .module import (
 )
 
 __all__ = [
+    "get_all_stock_info",
     "get_capital_increase_or_decrease_status",
     "get_dividend_status",
     "get_acquisition_of_treasury_stock",
@@ -1,22 +1,13 @@
-from enum import Enum
+from dart_mcp.api_clients.base.dart import report_url_builder
 
-from dart_mcp.settings.config import Settings
+build_capital_increase_or_decrease_status_url = report_url_builder("irdsSttus")
 
-BASE_URL = Settings.BASE_URL
-API_KEY = Settings.DART_API_KEY
+build_dividend_status_url = report_url_builder("alotMatter")
 
+build_acquisition_of_treasury_stock_url = report_url_builder("tesstkAcqsDspsSttus")
 
-class urls(Enum):
-    """DART API 엔드포인트 URL 템플릿을 정의하는 Enum 클래스입니다."""
+build_largest_shareholder_url = report_url_builder("hyslrSttus")
 
-    GET_CAPITAL_INCREASE_OR_DECREASE_STATUS: str = f"{BASE_URL}/irdsSttus.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}"
+build_largest_shareholder_changes_url = report_url_builder("hyslrChgSttus")
 
-    GET_DIVIDEND_STATUS: str = f"{BASE_URL}/alotMatter.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}"
-
-    GET_ACQUISITION_OF_TREASURY_STOCK: str = f"{BASE_URL}/tesstkAcqsDspsSttus.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}"
-
-    GET_LARGEST_SHAREHOLDER: str = f"{BASE_URL}/hyslrSttus.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}"
-
-    GET_LARGEST_SHAREHOLDER_CHANGES: str = f"{BASE_URL}/hyslrChgSttus.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}"
-
-    GET_MINOR_STOCK_STATUS: str = f"{BASE_URL}/mrhlSttus.json?crtfc_key={API_KEY}&corp_code={{corp_code}}&bsns_year={{bsns_year}}&reprt_code={{reprt_code}}"
+build_minor_stock_status_url = report_url_builder("mrhlSttus")
@@ -28,9 +28,9 @@ class CorpClassMapping(Enum):
         Returns:
             str: 매핑된 한글 법인구분명. 코드가 없거나 매핑되지 않으면 "알 수 없음"을 반환합니다.
         """
-        if code is None:
-            return cls.UNKNOWN.value[1]
-        for member in cls:
-            if member.value[0] == code:
-                return member.value[1]
-        return cls.UNKNOWN.value[1]
+        return _CORP_CLS_MAP.get(code, _UNKNOWN)
+
+
+# 코드 -> 한글 명칭 조회 테이블 (import 시 한 번만 생성)
+_CORP_CLS_MAP = {member.value[0]: member.value[1] for member in CorpClassMapping}
+_UNKNOWN = CorpClassMapping.UNKNOWN.value[1]
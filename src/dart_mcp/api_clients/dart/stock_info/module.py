@@ -1,13 +1,31 @@
 import logging
 from typing import Any
 
-from dart_mcp.api_clients.base.dart import _call_regular_report_api_template
-
-from .const import urls
+from dart_mcp.api_clients.base.dart import (
+    EndpointSpec,
+    _call_regular_report_api_template,
+    gather_endpoint_results,
+    process_items,
+)
+
+from .const import (
+    build_acquisition_of_treasury_stock_url,
+    build_capital_increase_or_decrease_status_url,
+    build_dividend_status_url,
+    build_largest_shareholder_changes_url,
+    build_largest_shareholder_url,
+    build_minor_stock_status_url,
+)
 from .mapping import CorpClassMapping
 
 logger = logging.getLogger(__name__)
 
+# 모든 주식 관련 엔드포인트에 공통인 후처리: 원본 코드 필드 제거 + 법인구분명 추가
+_SPEC = EndpointSpec(
+    drop=frozenset({"rcept_no", "corp_code", "corp_cls"}),
+    add=(("corp_cls_nm", "corp_cls", CorpClassMapping.get_korean_name),),
+)
+
 
 async def get_capital_increase_or_decrease_status(
     corp_code: str, bsns_year: str, reprt_code: str
@@ -33,21 +51,13 @@ async def get_capital_increase_or_decrease_status(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명: 유가증권, 코스닥, 코넥스, 기타, 알 수 없음)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_CAPITAL_INCREASE_OR_DECREASE_STATUS.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_capital_increase_or_decrease_status_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_capital_increase_or_decrease_status",
         corp_code_for_logging=corp_code,
     )
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _SPEC)
 
 
 async def get_dividend_status(
@@ -73,21 +83,11 @@ async def get_dividend_status(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명: 유가증권, 코스닥, 코넥스, 기타, 알 수 없음)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_DIVIDEND_STATUS.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-        ),
+        final_url=build_dividend_status_url(corp_code, bsns_year, reprt_code),
         api_name_for_logging="get_dividend_status",
         corp_code_for_logging=corp_code,
     )
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _SPEC)
 
 
 async def get_acquisition_of_treasury_stock(
@@ -118,21 +118,13 @@ async def get_acquisition_of_treasury_stock(
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명: 유가증권, 코스닥, 코넥스, 기타, 알 수 없음)
     """
     raw_list = await _call_regular_report_api_template(
-        final_url=urls.GET_ACQUISITION_OF_TREASURY_STOCK.value.format(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
+        final_url=build_acquisition_of_treasury_stock_url(
+            corp_code, bsns_year, reprt_code
         ),
         api_name_for_logging="get_acquisition_of_treasury_stock",
         corp_code_for_logging=corp_code,
     )
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _SPEC)
 
 
 async def get_largest_shareholder(
@@ -160,24 +152,12 @@ async def get_largest_shareholder(
             - stlm_dt (str): 결산기준일 (YYYY-MM-DD)
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
-    base_url_template = urls.GET_LARGEST_SHAREHOLDER.value
-    final_url = base_url_template.format(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
     raw_list = await _call_regular_report_api_template(
-        final_url=final_url,
+        final_url=build_largest_shareholder_url(corp_code, bsns_year, reprt_code),
         api_name_for_logging="get_largest_shareholder",
         corp_code_for_logging=corp_code,
     )
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _SPEC)
 
 
 async def get_largest_shareholder_changes(
@@ -203,24 +183,14 @@ async def get_largest_shareholder_changes(
             - stlm_dt (str): 결산기준일 (YYYY-MM-DD)
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
-    base_url_template = urls.GET_LARGEST_SHAREHOLDER_CHANGES.value
-    final_url = base_url_template.format(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
     raw_list = await _call_regular_report_api_template(
-        final_url=final_url,
+        final_url=build_largest_shareholder_changes_url(
+            corp_code, bsns_year, reprt_code
+        ),
         api_name_for_logging="get_largest_shareholder_changes",
         corp_code_for_logging=corp_code,
     )
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _SPEC)
 
 
 async def get_minor_stock_status(
@@ -247,21 +217,38 @@ async def get_minor_stock_status(
             - stlm_dt (str): 결산기준일 (YYYY-MM-DD)
             - corp_cls_nm (str): 법인구분명 (매핑된 한글명)
     """
-    base_url_template = urls.GET_MINOR_STOCK_STATUS.value
-    final_url = base_url_template.format(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
     raw_list = await _call_regular_report_api_template(
-        final_url=final_url,
+        final_url=build_minor_stock_status_url(corp_code, bsns_year, reprt_code),
         api_name_for_logging="get_minor_stock_status",
         corp_code_for_logging=corp_code,
     )
-    processed_list = []
-    keys_to_remove = ["rcept_no", "corp_code", "corp_cls"]
-    if raw_list:
-        for item in raw_list:
-            item["corp_cls_nm"] = CorpClassMapping.get_korean_name(item.get("corp_cls"))
-            for key_to_remove in keys_to_remove:
-                item.pop(key_to_remove, None)
-            processed_list.append(item)
-    return processed_list
+    return process_items(raw_list, _SPEC)
+
+
+async def get_all_stock_info(
+    corp_code: str, bsns_year: str, reprt_code: str
+) -> tuple[list[dict[str, Any]], ...]:
+    """주식 관련 6개 API를 동시에 호출합니다.
+
+    한 API에서 예외가 발생해도 나머지 요청은 취소되지 않으며,
+    실패한 API의 결과는 빈 리스트로 대체됩니다.
+
+    Args:
+        corp_code (str): 공시대상회사의 고유번호(8자리).
+        bsns_year (str): 사업연도(4자리).
+        reprt_code (str): 보고서 코드 (1분기: 11013, 반기: 11012, 3분기: 11014, 사업: 11011).
+
+    Returns:
+        tuple[list[dict[str, Any]], ...]: 다음 순서의 결과 리스트 튜플.
+            (최대주주 현황, 최대주주 변동현황, 소액주주 현황, 배당에 관한 사항,
+             증자(감자) 현황, 자기주식 취득 및 처분현황)
+    """
+    return await gather_endpoint_results(
+        get_largest_shareholder(corp_code, bsns_year, reprt_code),
+        get_largest_shareholder_changes(corp_code, bsns_year, reprt_code),
+        get_minor_stock_status(corp_code, bsns_year, reprt_code),
+        get_dividend_status(corp_code, bsns_year, reprt_code),
+        get_capital_increase_or_decrease_status(corp_code, bsns_year, reprt_code),
+        get_acquisition_of_treasury_stock(corp_code, bsns_year, reprt_code),
+        corp_code_for_logging=corp_code,
+    )
@@ -1,3 +1,4 @@
 from .dart_corp_list import DartCorpList
+from .dart_response_cache import DartResponseCache
 
-__all__ = ["DartCorpList"]
+__all__ = ["DartCorpList", "DartResponseCache"]
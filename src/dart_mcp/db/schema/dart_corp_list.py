@@ -1,11 +1,9 @@
-from dataclasses import dataclass
+from dart_mcp.settings.config import get_settings
 
-from dart_mcp.settings.config import Settings
 
-
-@dataclass
 class DartCorpList:
-    TABLE_NAME = Settings.COMPANY_LIST_TABLE
+    """DART 기업 목록 테이블의 이름과 컬럼 스키마. (인스턴스화하지 않는 네임스페이스)"""
+
     SCHEMA = {
         "corp_code": "TEXT",
         "corp_name": "TEXT",
@@ -13,3 +11,8 @@ class DartCorpList:
         "stock_code": "TEXT",
         "modify_date": "TEXT",
     }
+
+    @classmethod
+    def table_name(cls) -> str:
+        """설정의 테이블 이름을 반환합니다. (import 시 설정을 읽지 않도록 사용할 때 조회)"""
+        return get_settings().COMPANY_LIST_TABLE
@@ -0,0 +1,16 @@
+from dart_mcp.settings.config import get_settings
+
+
+class DartResponseCache:
+    """DART 정기보고서 응답을 저장하는 디스크 캐시 테이블의 이름과 컬럼 스키마."""
+
+    SCHEMA = {
+        "url": "TEXT PRIMARY KEY",
+        "expires_at": "REAL NOT NULL",
+        "body": "BLOB NOT NULL",
+    }
+
+    @classmethod
+    def table_name(cls) -> str:
+        """설정의 테이블 이름을 반환합니다. (import 시 설정을 읽지 않도록 사용할 때 조회)"""
+        return get_settings().RESPONSE_CACHE_TABLE
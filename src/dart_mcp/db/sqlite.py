@@ -2,6 +2,8 @@
 #   - 핵심 책임: SQLite 데이터베이스 상호작용 캡슐화 (연결, CRUD, 트랜잭션 관리).
 #   - 주요 특징: 컨텍스트 관리자 프로토콜(`with` 구문) 지원으로 안전한 자원 관리.
 #              데이터 삽입 시 Pydantic 모델을 활용하여 타입 안정성 및 유효성 검사 강화.
+#   - 성능 설정: 연결 시 WAL 저널 + synchronous=NORMAL 등 PRAGMA를 적용해
+#              커밋마다 fsync하지 않고, 읽기 위주 조회는 mmap/페이지 캐시로 처리합니다.
 #   - 사용시 핵심: `with` 구문을 통한 자동 커밋/롤백 또는 명시적 호출로 트랜잭션 관리.
 
 import logging
@@ -11,6 +13,30 @@ from typing import Any  # Dict, List 추가
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 연결 시 적용할 PRAGMA (journal_mode=WAL은 DB 파일에 유지되며, 나머지는 연결 단위 설정)
+_CONNECT_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-20000;
+"""
+
+# (테이블명, 컬럼명 튜플) -> INSERT 문. 같은 형태의 삽입마다 SQL 문자열을 다시 만들지 않도록 캐시
+_INSERT_SQL_CACHE: dict[tuple[str, tuple[str, ...]], str] = {}
+
+
+def _insert_sql(table_name: str, columns: tuple[str, ...]) -> str:
+    """`table_name`과 `columns`에 대한 INSERT 문을 반환합니다. (최초 1회만 생성)"""
+    key = (table_name, columns)
+    sql = _INSERT_SQL_CACHE.get(key)
+    if sql is None:
+        placeholders = ", ".join("?" * len(columns))
+        sql = _INSERT_SQL_CACHE[key] = (
+            f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+        )
+    return sql
+
 
 class SQLiteDB:
     """
@@ -33,17 +59,28 @@ class SQLiteDB:
         """
         DB 연결 및 커서 생성 (컨텍스트 관리자 진입).
 
+        Returns:
+            SQLiteDB: 연결된 self 인스턴스.
+        Raises:
+            sqlite3.Error: 연결 실패 시.
+        """
+        return self.connect()
+
+    def connect(self):
+        """
+        DB에 연결하고 커서를 생성합니다. `with` 블록 밖에서 연결을 오래 유지할 때 사용하며,
+        이 경우 커밋과 연결 종료는 호출하는 쪽에서 처리합니다.
+
         Returns:
             SQLiteDB: 연결된 self 인스턴스.
         Raises:
             sqlite3.Error: 연결 실패 시.
         """
         try:
+            # row_factory는 설정하지 않음 (행은 튜플로 받고, fetch_* 에서 컬럼명과 묶어 딕셔너리로 변환)
             self.conn = sqlite3.connect(self.db_path)
-            self.conn.row_factory = (
-                sqlite3.Row
-            )  # 컬럼 이름으로 접근 가능하도록 row_factory 설정
             self.cursor = self.conn.cursor()
+            self.cursor.executescript(_CONNECT_PRAGMAS)
             logger.info(f"'{self.db_path}'에 성공적으로 연결되었습니다.")
             return self
         except sqlite3.Error as e:
@@ -81,16 +118,11 @@ class SQLiteDB:
                         f"데이터베이스 연결 종료 중 오류 발생: {e_close}", exc_info=True
                     )
 
-    def execute_sql(self, sql_query: str, params: tuple[Any, ...] | None = None):
+    def _execute(
+        self, sql_query: str, params: tuple[Any, ...] | None = None
+    ) -> sqlite3.Cursor:
         """
-        단일 DML/DDL SQL 쿼리를 실행합니다 (SELECT 문에는 부적합).
-
-        Args:
-            sql_query: 실행할 SQL 쿼리.
-            params: 쿼리 파라미터 (선택 사항).
-
-        Returns:
-            int | None: INSERT 시 `lastrowid`, 그 외 DML은 `rowcount`.
+        단일 SQL 쿼리를 실행하고 커서를 반환합니다. (`execute_sql`/`_execute_insert` 공통 처리)
 
         Raises:
             sqlite3.Error: DB 미연결 또는 SQL 실행 오류.
@@ -101,12 +133,8 @@ class SQLiteDB:
 
         try:
             self.cursor.execute(sql_query, params or ())
-            logger.debug(f"SQL 실행 성공: {sql_query}, Params: {params}")
-            return (
-                self.cursor.lastrowid
-                if "insert" in sql_query.lower()
-                else self.cursor.rowcount
-            )
+            logger.debug("SQL 실행 성공: %s, Params: %s", sql_query, params)
+            return self.cursor
         except sqlite3.Error as e:
             logger.error(f"SQL 실행 오류: {e}", exc_info=True)
             logger.error(f"실패한 쿼리: {sql_query}")
@@ -114,6 +142,28 @@ class SQLiteDB:
                 logger.error(f"파라미터: {params}")
             raise e
 
+    def execute_sql(self, sql_query: str, params: tuple[Any, ...] | None = None) -> int:
+        """
+        단일 DML/DDL SQL 쿼리를 실행합니다 (SELECT 문에는 부적합).
+
+        Args:
+            sql_query: 실행할 SQL 쿼리.
+            params: 쿼리 파라미터 (선택 사항).
+
+        Returns:
+            int: 영향을 받은 행 수 (`rowcount`). 삽입된 행 ID가 필요하면 `insert_one_dict`를 사용합니다.
+
+        Raises:
+            sqlite3.Error: DB 미연결 또는 SQL 실행 오류.
+        """
+        return self._execute(sql_query, params).rowcount
+
+    def _execute_insert(
+        self, sql_query: str, params: tuple[Any, ...] | None = None
+    ) -> int | None:
+        """INSERT 쿼리를 실행하고 삽입된 행 ID(`lastrowid`)를 반환합니다."""
+        return self._execute(sql_query, params).lastrowid
+
     def execute_script(self, sql_script: str) -> bool:
         """
         여러 SQL 문으로 구성된 스크립트를 실행합니다.
@@ -164,9 +214,14 @@ class SQLiteDB:
             self.cursor.execute(sql_query, params or ())
             row = self.cursor.fetchone()
             logger.debug(
-                f"Fetch one 성공: {sql_query}, Params: {params}, Result: {'데이터 있음' if row else '데이터 없음'}"
+                "Fetch one 성공: %s, Params: %s, Result: %s",
+                sql_query,
+                params,
+                "데이터 있음" if row else "데이터 없음",
             )
-            return dict(row) if row else None
+            if row is None:
+                return None
+            return dict(zip(self._column_names(), row))
         except sqlite3.Error as e:
             logger.error(f"Fetch one 오류: {e}", exc_info=True)
             logger.error(f"실패한 쿼리: {sql_query}")
@@ -198,9 +253,15 @@ class SQLiteDB:
             self.cursor.execute(sql_query, params or ())
             rows = self.cursor.fetchall()
             logger.debug(
-                f"Fetch all 성공: {sql_query}, Params: {params}, Results count: {len(rows)}"
+                "Fetch all 성공: %s, Params: %s, Results count: %s",
+                sql_query,
+                params,
+                len(rows),
             )
-            return [dict(row) for row in rows]
+            # 컬럼명 튜플은 한 번만 만들고, 지역 변수로 바인딩해 행마다의 조회 비용을 줄임
+            columns = self._column_names()
+            _dict, _zip = dict, zip
+            return [_dict(_zip(columns, row)) for row in rows]
         except sqlite3.Error as e:
             logger.error(f"Fetch all 오류: {e}", exc_info=True)
             logger.error(f"실패한 쿼리: {sql_query}")
@@ -208,6 +269,36 @@ class SQLiteDB:
                 logger.error(f"파라미터: {params}")
             raise e
 
+    def _column_names(self) -> tuple[str, ...]:
+        """마지막으로 실행한 SELECT 쿼리 결과의 컬럼명 튜플을 반환합니다."""
+        return tuple(column[0] for column in self.cursor.description)
+
+    def begin(self, bulk_mode: bool = False) -> None:
+        """
+        명시적으로 쓰기 트랜잭션(`BEGIN IMMEDIATE`)을 시작합니다.
+        이후의 DDL/DML은 모두 같은 트랜잭션에 포함되어 `with` 블록 종료 시 함께 커밋/롤백되며,
+        WAL 모드에서는 커밋 전까지 다른 연결이 이전 데이터를 그대로 읽습니다.
+
+        Args:
+            bulk_mode: True 시 트랜잭션 시작 전에 `synchronous=OFF`를 적용.
+                (SQLite는 트랜잭션 안에서 synchronous 변경을 허용하지 않음)
+                연결 단위 설정이므로 `with` 블록이 끝나 연결이 닫히면 기본값으로 돌아갑니다.
+                커밋 도중 프로세스가 죽으면 DB가 손상될 수 있으므로,
+                다시 만들 수 있는 데이터(예: DART 기업 목록)의 적재에만 사용합니다.
+
+        Raises:
+            sqlite3.Error: DB 미연결, 이미 트랜잭션이 진행 중이거나 실행 오류.
+        """
+        if not self.conn or not self.cursor:
+            logger.error("데이터베이스 미연결 상태에서 트랜잭션 시작 시도.")
+            raise sqlite3.Error("데이터베이스에 연결되어 있지 않습니다.")
+        if self.conn.in_transaction:
+            raise sqlite3.Error("이미 트랜잭션이 진행 중입니다.")
+
+        if bulk_mode:
+            self.cursor.execute("PRAGMA synchronous=OFF")
+        self.cursor.execute("BEGIN IMMEDIATE")
+
     def commit(self):
         """
         명시적 커밋. `with` 구문 사용 시 자동 처리되므로 특수한 경우에만 사용.
@@ -313,13 +404,11 @@ class SQLiteDB:
             logger.warning("삽입할 딕셔너리 데이터가 없습니다.")
             raise ValueError("삽입할 데이터 딕셔너리가 비어있습니다.")
 
-        columns = ", ".join(data_dict.keys())
-        placeholders = ", ".join(["?"] * len(data_dict))
+        sql = _insert_sql(table_name, tuple(data_dict))
         values = tuple(data_dict.values())
-        sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
 
         try:
-            last_row_id = self.execute_sql(sql, values)
+            last_row_id = self._execute_insert(sql, values)
             logger.info(
                 f"테이블 '{table_name}'에 딕셔너리로부터 단일 행 삽입 성공. ID: {last_row_id}"
             )
@@ -329,7 +418,10 @@ class SQLiteDB:
             raise e
 
     def insert_many_dicts(
-        self, table_name: str, data_list_of_dicts: list[dict[str, Any]]
+        self,
+        table_name: str,
+        data_list_of_dicts: list[dict[str, Any]],
+        bulk_mode: bool = False,
     ) -> bool:
         """
         딕셔너리 리스트로부터 여러 행 동시 삽입.
@@ -337,6 +429,8 @@ class SQLiteDB:
         Args:
             table_name: 테이블 이름.
             data_list_of_dicts: 삽입할 데이터 딕셔너리 리스트.
+            bulk_mode: 진행 중인 트랜잭션이 없어 새로 시작할 때 `begin(bulk_mode=True)`로 시작.
+                이미 `begin()`으로 시작한 트랜잭션 안이라면 무시됩니다.
 
         Returns:
             True: 성공 시.
@@ -361,8 +455,7 @@ class SQLiteDB:
                     "다중 딕셔너리 삽입 시 첫 번째 항목이 딕셔너리가 아닙니다."
                 )
                 raise ValueError("데이터는 딕셔너리리의 리스트여야 합니다.")
-            columns = ", ".join(first_dict.keys())
-            placeholders = ", ".join(["?"] * len(first_dict))
+            sql = _insert_sql(table_name, tuple(first_dict))
 
         except (
             IndexError,
@@ -376,25 +469,25 @@ class SQLiteDB:
                 "삽입할 딕셔너리 리스트가 비어있거나 첫 번째 딕셔너리의 형식이 잘못되었습니다."
             ) from e
 
-        sql = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
-
-        try:
-            values_list = [tuple(data.values()) for data in data_list_of_dicts]
+        # 진행 중인 트랜잭션이 없으면 명시적으로 시작 (커밋은 `with` 블록 종료 시)
+        if not self.conn.in_transaction:
+            self.begin(bulk_mode=bulk_mode)
 
-        except (AttributeError, TypeError) as e:  # TypeError 추가
-            logger.error(f"다중 딕셔너리 삽입 중 값 추출 오류: {e}", exc_info=True)
-            raise ValueError("삽입할 딕셔너리 중 일부가 잘못된 형식입니다.") from e
+        # 값 튜플 리스트를 미리 만들지 않고 제너레이터로 넘겨 메모리 사용량을 줄임
+        values_iter = (tuple(data.values()) for data in data_list_of_dicts)
 
         try:
-            self.cursor.executemany(sql, values_list)
+            self.cursor.executemany(sql, values_iter)
             logger.info(
                 f"테이블 '{table_name}'에 {self.cursor.rowcount}개 행 (딕셔너리 리스트로부터) 다중 삽입 성공."
             )
             return True
 
+        except (AttributeError, TypeError) as e:  # 제너레이터에서 값 추출 중 발생
+            logger.error(f"다중 딕셔너리 삽입 중 값 추출 오류: {e}", exc_info=True)
+            raise ValueError("삽입할 딕셔너리 중 일부가 잘못된 형식입니다.") from e
+
         except sqlite3.Error as e:
             logger.error(f"다중 딕셔너리 삽입 오류: {e}", exc_info=True)
-            logger.error(
-                f"실패한 쿼리 (일부): INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
-            )
+            logger.error(f"실패한 쿼리 (일부): {sql}")
             raise e
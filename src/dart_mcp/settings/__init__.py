@@ -1,3 +1,3 @@
-from .config import Settings
+from .config import get_db, get_settings
 
-__all__ = ["Settings"]
\ No newline at end of file
+__all__ = ["get_db", "get_settings"]
@@ -1,11 +1,25 @@
+import functools
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
+
 from dart_mcp.db.sqlite import SQLiteDB
 
+
 class _Settings(BaseSettings):
     BASE_URL: str = "https://opendart.fss.or.kr/api"
     DART_API_KEY: str
     DB_PATH: str = "sqlite/dart.db"
     COMPANY_LIST_TABLE: str = "dart_corp_list"
+    RESPONSE_CACHE_TABLE: str = "dart_response_cache"
+    # 지난 사업연도의 데이터가 있는 응답의 메모리 캐시 유지 시간(초). 0 이하이면 캐시 사용 안 함
+    DART_CACHE_TTL: int = 6 * 3600
+    # 진행 중인 사업연도 응답과 데이터가 없는 응답(013)의 메모리 캐시 유지 시간(초).
+    # 새로 제출된 보고서가 빨리 보이도록 짧게 유지하며, 0 이하이면 캐시 사용 안 함
+    DART_OPEN_PERIOD_CACHE_TTL: int = 300
+    # 지난 사업연도 응답의 디스크 캐시 유지 시간(초). 0 이하이면 디스크 캐시 사용 안 함
+    DART_DISK_CACHE_TTL: int = 30 * 24 * 3600
+    DART_CACHE_MAXSIZE: int = 4096
+    DART_MAX_CONCURRENCY: int = 32  # 동시에 진행할 수 있는 DART API 요청 수
 
     model_config = SettingsConfigDict(
         env_file_encoding="utf-8",
@@ -13,5 +27,13 @@ class _Settings(BaseSettings):
     )
 
 
-Settings = _Settings()
-DB_INSTANCE = SQLiteDB(db_path=Settings.DB_PATH)
+@functools.cache
+def get_settings() -> _Settings:
+    """설정을 처음 사용할 때 한 번만 읽어 검증하고, 이후에는 같은 인스턴스를 반환합니다."""
+    return _Settings()
+
+
+@functools.cache
+def get_db() -> SQLiteDB:
+    """설정의 DB_PATH를 사용하는 공유 SQLiteDB 인스턴스를 반환합니다."""
+    return SQLiteDB(db_path=get_settings().DB_PATH)
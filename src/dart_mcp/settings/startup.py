@@ -1,41 +1,207 @@
+import asyncio
+import json
 import logging
+from pathlib import Path
+from typing import Any
 
 from dart_mcp.api_clients.dart.corp_list import get_corp_list
 from dart_mcp.db.schema import DartCorpList
-from dart_mcp.settings.config import DB_INSTANCE
+from dart_mcp.db.sqlite import SQLiteDB
+from dart_mcp.settings.config import get_db, get_settings
 
 logger = logging.getLogger(__name__)
 
+_fetch_task: asyncio.Task[None] | None = None
 
-def fetch_dart_corp_list():
+# corp_code -> 기업 정보. 기업 목록은 하루 단위로만 바뀌므로 한 번 읽어 메모리에 두고 공유
+_CORP_CACHE_COLUMNS = ("corp_code", "corp_name", "corp_eng_name", "stock_code")
+_corp_cache: dict[str, dict[str, Any]] | None = None
+# 저장된 테이블을 읽는 작업. 동시에 들어온 요청이 같은 작업을 기다리도록 하나만 둠
+_corp_cache_task: asyncio.Task[dict[str, dict[str, Any]]] | None = None
+
+
+def _cache_headers_path() -> Path:
     """
-    Fetch Dart Corp List from DART API and save to SQLite DB
+    Path of the ETag/Last-Modified file saved next to the DB file,
+    used for conditional requests after a restart.
     """
+    return Path(get_settings().DB_PATH).with_name("corp_list_headers.json")
 
-    data = get_corp_list()
-    logger.info(f"Fetching Company List: {len(data)}")
 
-    with DB_INSTANCE as db:
+def _load_cache_headers() -> dict[str, str]:
+    """
+    Load the saved ETag/Last-Modified of the last Dart Corp List download.
+    Returns an empty dict when the table is missing or empty, so a full
+    download is forced.
+    """
+    cache_headers_path = _cache_headers_path()
+    if not cache_headers_path.exists():
+        return {}
+
+    with get_db() as db:
+        table = db.fetch_one(
+            sql_query="SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+            params=(DartCorpList.table_name(),),
+        )
+        if table is None:
+            return {}
+        row = db.fetch_one(
+            sql_query=f"SELECT 1 FROM {DartCorpList.table_name()} LIMIT 1"
+        )
+        if row is None:
+            return {}
+
+    try:
+        return json.loads(cache_headers_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning("Failed to read %s: %r", cache_headers_path, e)
+        return {}
+
+
+def _save_cache_headers(cache_headers: dict[str, str]) -> None:
+    """
+    Save the ETag/Last-Modified of the Dart Corp List download.
+    """
+    _cache_headers_path().write_text(json.dumps(cache_headers), encoding="utf-8")
+
+
+def _save_corp_list(data: list[dict[str, Any]]) -> None:
+    """
+    Save Dart Corp List to SQLite DB (blocking, run in a worker thread)
+    """
+    with get_db() as db:
+        # 테이블 삭제/생성/삽입을 한 트랜잭션으로 묶어, 적재 중이거나 실패하더라도
+        # 다른 연결은 이전 기업 목록을 그대로 읽도록 함
+        db.begin(bulk_mode=True)
+
         db.create_table(
-            table_name=DartCorpList.TABLE_NAME,
+            table_name=DartCorpList.table_name(),
             columns_schema=DartCorpList.SCHEMA,
             drop_if_exists=True,
         )
 
         db.insert_many_dicts(
-            table_name=DartCorpList.TABLE_NAME, data_list_of_dicts=data
+            table_name=DartCorpList.table_name(), data_list_of_dicts=data
         )
 
         total_inserted = db.fetch_one(
-            sql_query=f"SELECT COUNT(1) FROM {DartCorpList.TABLE_NAME}"
+            sql_query=f"SELECT COUNT(1) FROM {DartCorpList.table_name()}"
         )
 
         count_value = total_inserted["COUNT(1)"]
-        logger.info(f"Total number of companies: {count_value}")
+        logger.info("Total number of companies: %s", count_value)
 
         if count_value != len(data):
             error_message = f"Total number of companies mismatch: DB count {count_value}, Fetched count {len(data)}"
             logger.error(error_message)
             raise Exception(error_message)
 
-        logger.info("Fetching Company List: Success")
+
+def _build_corp_cache(rows: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """
+    Build the corp_code -> corp info cache, keeping only the columns
+    returned to tool callers.
+    """
+    columns = _CORP_CACHE_COLUMNS
+    return {
+        row["corp_code"]: {column: row.get(column) for column in columns}
+        for row in rows
+    }
+
+
+def _load_corp_cache() -> dict[str, dict[str, Any]]:
+    """
+    Load the corp cache from the saved Dart Corp List table (blocking).
+    Uses its own connection: the shared get_db() instance keeps a single
+    connection and may be in use by the background fetch at the same time.
+    """
+    with SQLiteDB(db_path=get_settings().DB_PATH) as db:
+        rows = db.fetch_all(
+            sql_query=f"SELECT {', '.join(_CORP_CACHE_COLUMNS)} "
+            f"FROM {DartCorpList.table_name()}"
+        )
+    return _build_corp_cache(rows)
+
+
+async def get_corp_cache() -> dict[str, dict[str, Any]]:
+    """
+    Return the in-memory corp_code -> corp info cache of the Dart Corp List.
+    Waits for the background load, and reads the saved table on first use
+    when the list was not re-downloaded. Concurrent callers share one read;
+    if it fails, the next call tries again.
+    """
+    global _corp_cache, _corp_cache_task
+    await wait_for_dart_corp_list()
+    if _corp_cache is not None:
+        return _corp_cache
+
+    task = _corp_cache_task
+    if task is None:
+        task = asyncio.create_task(asyncio.to_thread(_load_corp_cache))
+        _corp_cache_task = task
+    try:
+        corp_cache = await asyncio.shield(task)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        if _corp_cache_task is task:
+            _corp_cache_task = None
+        raise
+    if _corp_cache is None:
+        _corp_cache = corp_cache
+    if _corp_cache_task is task:
+        _corp_cache_task = None
+    return _corp_cache
+
+
+async def fetch_dart_corp_list():
+    """
+    Fetch Dart Corp List from DART API and save to SQLite DB
+    """
+
+    cache_headers = await asyncio.to_thread(_load_cache_headers)
+    data, cache_headers = await get_corp_list(cache_headers)
+    if data is None:
+        logger.info("Fetching Company List: Not modified, reusing saved table")
+        return
+
+    logger.info("Fetching Company List: %s", len(data))
+
+    await asyncio.to_thread(_save_corp_list, data)
+    await asyncio.to_thread(_save_cache_headers, cache_headers)
+
+    global _corp_cache
+    _corp_cache = _build_corp_cache(data)
+
+    logger.info("Fetching Company List: Success")
+
+
+def start_fetch_dart_corp_list() -> asyncio.Task[None]:
+    """
+    Start loading the Dart Corp List in the background so the server can
+    accept requests while the list is being downloaded and saved.
+    """
+    global _fetch_task
+    if _fetch_task is None:
+        _fetch_task = asyncio.create_task(fetch_dart_corp_list())
+    return _fetch_task
+
+
+async def wait_for_dart_corp_list() -> None:
+    """
+    Wait until the background Dart Corp List load (if any) has finished.
+    A failed load is logged once and forgotten, so callers fall back to the
+    previously saved table instead of re-raising the same error forever.
+    """
+    global _fetch_task
+    task = _fetch_task
+    if task is None:
+        return
+    try:
+        await asyncio.shield(task)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        if _fetch_task is task:
+            logger.error("Fetching Company List: Failed: %r", e)
+            _fetch_task = None
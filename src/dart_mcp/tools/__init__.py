@@ -1,4 +1,7 @@
-from .find_company_by_name import find_company_corp_code_by_name
+from .find_company_by_name import (
+    find_company_corp_code_by_name,
+    warm_up_company_search,
+)
 from .get_company_financial_stmt_list import get_company_financial_stmt_list
 from .get_debt_summary import get_debt_summary
 from .get_financial_stmt import get_financial_stmt
@@ -14,4 +17,5 @@ __all__ = [
     "get_investment_summary",
     "get_people_summary",
     "get_stock_summary",
+    "warm_up_company_search",
 ]
@@ -1,10 +1,143 @@
+import functools
+import heapq
+import logging
+import time
 from typing import Any
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from dart_mcp.settings.startup import get_corp_cache
 
-from dart_mcp.db.schema import DartCorpList
-from dart_mcp.settings.config import DB_INSTANCE
+logger = logging.getLogger(__name__)
+
+_SEARCH_CACHE_TTL_SECONDS = 3600
+_SEARCH_CACHE_MAXSIZE = 1024
+# 이보다 짧은 검색어는 후보가 너무 많고 종류도 많아 캐시하지 않음
+_SEARCH_CACHE_MIN_LENGTH = 2
+
+# (정규화된 회사명, k) -> (만료 시각, 검색 결과). 기업 목록이 다시 적재되면 비움
+_search_cache: dict[tuple[str, int], tuple[float, list[dict[str, Any]]]] = {}
+_search_cache_source: dict[str, dict[str, Any]] | None = None
+
+
+def _get_cached_search(
+    key: tuple[str, int], corp_cache: dict[str, dict[str, Any]]
+) -> list[dict[str, Any]] | None:
+    """캐시된 검색 결과가 유효하면 그 복사본을, 없거나 만료되었으면 None을 반환합니다."""
+    global _search_cache_source
+    if _search_cache_source is not corp_cache:
+        # 기업 목록이 새로 적재되었으므로 이전 목록 기준의 결과는 모두 버림
+        _search_cache.clear()
+        _search_cache_source = corp_cache
+        return None
+
+    entry = _search_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, results = entry
+    if expires_at < time.monotonic():
+        _search_cache.pop(key, None)
+        return None
+    # 최근 사용 항목을 맨 뒤로 옮겨 LRU 순서를 유지
+    _search_cache[key] = _search_cache.pop(key)
+    return list(results)
+
+
+def _set_cached_search(key: tuple[str, int], results: list[dict[str, Any]]) -> None:
+    """검색 결과를 TTL과 함께 캐시에 저장합니다."""
+    if len(_search_cache) >= _SEARCH_CACHE_MAXSIZE:
+        # 가장 오래 사용되지 않은 항목 제거
+        _search_cache.pop(next(iter(_search_cache)))
+    _search_cache[key] = (
+        time.monotonic() + _SEARCH_CACHE_TTL_SECONDS,
+        list(results),
+    )
+
+
+# (소문자 회사명, 기업 정보) 목록. 기업 목록 객체마다 한 번만 만들어 검색마다 lower()를 반복하지 않음
+_name_index: list[tuple[str, dict[str, Any]]] = []
+_name_index_source: dict[str, dict[str, Any]] | None = None
+
+_NGRAM_SIZE = 2
+_NGRAM_CACHE_MAXSIZE = 65536
+
+
+@functools.lru_cache(maxsize=_NGRAM_CACHE_MAXSIZE)
+def _name_ngrams(name_lc: str) -> frozenset[str]:
+    """
+    소문자로 변환된 회사명의 문자 n-gram 집합을 반환합니다.
+    앞뒤에 공백을 붙여 짧은 이름에도 n-gram이 생기고, 앞/뒤가 일치하는 이름이 더 유사하게 평가됩니다.
+    기업 목록은 세션 동안 거의 바뀌지 않으므로 이름별 결과를 캐시합니다.
+    """
+    padded = f" {name_lc} "
+    return frozenset(
+        padded[i : i + _NGRAM_SIZE] for i in range(len(padded) - _NGRAM_SIZE + 1)
+    )
+
+
+def _get_name_index(
+    corp_cache: dict[str, dict[str, Any]],
+) -> list[tuple[str, dict[str, Any]]]:
+    """기업 목록의 (소문자 회사명, 기업 정보) 목록을 반환합니다. (기업 목록이 바뀌면 새로 만듦)"""
+    global _name_index, _name_index_source
+    if _name_index_source is not corp_cache:
+        _name_index = [
+            (row["corp_name"].lower(), row)
+            for row in corp_cache.values()
+            if row["corp_name"]
+        ]
+        _name_index_source = corp_cache
+    return _name_index
+
+
+def _search_corp(
+    corp_name: str, k: int, corp_cache: dict[str, dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """기업 목록에서 회사명을 검색해 유사도 순으로 정렬합니다."""
+    # SQLite LIKE 전체 스캔 대신 메모리의 기업 목록에서 부분 문자열 검색 (대소문자 무시)
+    search_term = corp_name.lower()
+    name_index = _get_name_index(corp_cache)
+    if not search_term:
+        # 빈 검색어는 모든 회사와 일치하고 유사도도 모두 같으므로 점수 계산 없이 기존 순서로 반환
+        return [row for _, row in name_index[:k]]
+
+    db_results = [
+        (name_lc, row) for name_lc, row in name_index if search_term in name_lc
+    ]
+
+    if not db_results:
+        return []
+
+    # 입력과 정확히 일치하는 회사는 유사도가 가장 높으므로 점수 계산 없이 맨 앞에 둠
+    exact_matches = [row for name_lc, row in db_results if name_lc == search_term]
+    if len(exact_matches) >= k:
+        return exact_matches[:k]
+
+    # 나머지는 문자 n-gram 집합의 자카드 유사도로 정렬 (동점은 기존 순서 유지)
+    query_ngrams = _name_ngrams(search_term)
+    scored_results = []
+    for name_lc, row in db_results:
+        if name_lc == search_term:
+            continue
+        ngrams = _name_ngrams(name_lc)
+        score = len(query_ngrams & ngrams) / len(query_ngrams | ngrams)
+        scored_results.append((score, row))
+
+    # 전체 정렬 대신 상위 k개만 선택 (O(N log k), 정렬 후 자르기와 같은 결과)
+    top = heapq.nlargest(k - len(exact_matches), scored_results, key=lambda x: x[0])
+
+    return exact_matches + [row for _, row in top]
+
+
+async def warm_up_company_search() -> None:
+    """
+    기업 목록 캐시와 회사명 검색 색인을 미리 만들어 첫 검색 요청이 바로 처리되도록 합니다.
+    서버 시작 시 백그라운드 태스크로 실행합니다. 기업 목록 다운로드가 실패하면 저장된 테이블을 사용하고,
+    테이블 적재까지 실패하면 경고만 남깁니다. (다음 검색 요청이 적재를 다시 시도함)
+    """
+    try:
+        corp_cache = await get_corp_cache()
+        _get_name_index(corp_cache)
+    except Exception as e:
+        logger.warning("Company search warm-up failed: %r", e)
 
 
 async def find_company_corp_code_by_name(
@@ -12,6 +145,7 @@ async def find_company_corp_code_by_name(
 ) -> list[dict[str, Any]]:
     """
     회사명을 이용하여 가장 유사한 회사 정보를 우선적으로 정렬하여 조회합니다.
+    같은 회사명(대소문자, 앞뒤 공백 무시)과 k의 결과는 일정 시간 캐시됩니다.
 
     Args:
         corp_name (str): 조회할 회사명
@@ -22,36 +156,17 @@ async def find_company_corp_code_by_name(
                                각 항목은 회사 정보를 담은 딕셔너리입니다.
                                결과가 없으면 빈 리스트를 반환합니다.
     """
-    search_term = f"%{corp_name}%"
-    sql_query = f"""
-        SELECT corp_code, corp_name, corp_eng_name, stock_code
-        FROM {DartCorpList.TABLE_NAME} 
-        WHERE corp_name LIKE ?
-    """
-
-    with DB_INSTANCE as db:
-        db_results = db.fetch_all(sql_query=sql_query, params=(search_term,))
-
-    if not db_results:
-        return []
+    corp_cache = await get_corp_cache()
 
-    candidate_corp_names = [row["corp_name"] for row in db_results]
+    corp_name = corp_name.strip()
+    if len(corp_name) < _SEARCH_CACHE_MIN_LENGTH:
+        return _search_corp(corp_name, k, corp_cache)
 
-    all_names = [corp_name] + candidate_corp_names
+    key = (corp_name.lower(), k)
+    cached = _get_cached_search(key, corp_cache)
+    if cached is not None:
+        return cached
 
-    try:
-        vectorizer = TfidfVectorizer()
-        tfidf_matrix = vectorizer.fit_transform(all_names)
-        cosine_sim_scores = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:])[0]
-
-        scored_results = []
-        for i, score in enumerate(cosine_sim_scores):
-            scored_results.append((score, db_results[i]))
-
-        scored_results.sort(key=lambda x: x[0], reverse=True)
-
-        return [row for _, row in scored_results][:k]
-
-    except Exception as e:
-        print(f"Error during similarity calculation: {e}. Returning original order.")
-        return db_results
+    results = _search_corp(corp_name, k, corp_cache)
+    _set_cached_search(key, results)
+    return results
@@ -5,8 +5,12 @@
     - SRP(단일 책임 원칙): 부채 요약 정보 제공이라는 단일 책임을 갖습니다.
     - OCP(개방-폐쇄 원칙): 향후 새로운 부채 관련 정보 항목이 추가될 경우, 기존 코드를 수정하기보다는 새로운 항목을 추가하는 방식으로 확장 가능하도록 고려합니다.
 - **기술적 고려사항**:
-    - 비동기 처리: DART API 호출은 `async/await`를 사용하여 비동기적으로 처리합니다.
-    - 오류 처리: 각 API 호출의 예외를 적절히 처리하여 안정성을 높입니다.
+    - 비동기 처리: DART API 호출은 `async/await`를 사용하며, 서로 독립적인 엔드포인트들은 `get_all_debt_info`(내부적으로 `asyncio.gather`)로 동시에 요청합니다.
+    - 오류 처리: 한 API 호출이 실패해도 해당 항목만 빈 리스트로 대체되고 나머지 정보는 반환됩니다.
+    - 응답 크기: 값이 없는(None 또는 빈 문자열) 필드는 제거하여 LLM에 전달되는 토큰 수를 줄입니다. ("-"는 유지)
+    - 단일 응답: 여섯 항목을 한 번의 도구 응답으로 묶어 반환합니다.
+      FastMCP는 세션 단위로 요청을 순차 처리하므로, 도구 내부에서 `ctx.sample(...)`을 동시에
+      여러 번 호출하더라도 직렬화됩니다. 항목별 요약 호출로 나누지 말고 한 번에 전달합니다.
 - **사용 시 고려사항**:
     - `corp_code`, `bsns_year`, `reprt_code`는 필수 인자입니다.
     - 반환되는 딕셔너리의 키는 한글로 명시되어 각 정보를 명확히 구분합니다.
@@ -14,14 +18,8 @@
 
 from typing import Any
 
-from dart_mcp.api_clients.dart.debt_info import (
-    get_commercial_paper_outstanding_balance,
-    get_contingent_capital_securities_outstanding_balance,
-    get_corporate_bonds_outstanding_balance,
-    get_debt_securities_issuance_status,
-    get_new_capital_securities_outstanding_balance,
-    get_short_term_bonds_outstanding_balance,
-)
+from dart_mcp.api_clients.base.dart import drop_empty_fields
+from dart_mcp.api_clients.dart.debt_info import get_all_debt_info
 
 
 async def get_debt_summary(
@@ -46,32 +44,22 @@ async def get_debt_summary(
                             "채무증권 발행실적": ...
                         }
     """
-    corporate_bonds_data = await get_corporate_bonds_outstanding_balance(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    commercial_paper_data = await get_commercial_paper_outstanding_balance(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    contingent_capital_data = (
-        await get_contingent_capital_securities_outstanding_balance(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-        )
-    )
-    new_capital_securities_data = await get_new_capital_securities_outstanding_balance(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    short_term_bonds_data = await get_short_term_bonds_outstanding_balance(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    debt_issuance_data = await get_debt_securities_issuance_status(
+    (
+        corporate_bonds_data,
+        commercial_paper_data,
+        contingent_capital_data,
+        new_capital_securities_data,
+        short_term_bonds_data,
+        debt_issuance_data,
+    ) = await get_all_debt_info(
         corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
     )
 
     return {
-        "회사채 미상환 잔액": corporate_bonds_data,
-        "기업어음증권 미상환 잔액": commercial_paper_data,
-        "조건부자본증권 미상환 잔액": contingent_capital_data,
-        "신종자본증권 미상환 잔액": new_capital_securities_data,
-        "단기사채 미상환 잔액": short_term_bonds_data,
-        "채무증권 발행실적": debt_issuance_data,
+        "회사채 미상환 잔액": drop_empty_fields(corporate_bonds_data),
+        "기업어음증권 미상환 잔액": drop_empty_fields(commercial_paper_data),
+        "조건부자본증권 미상환 잔액": drop_empty_fields(contingent_capital_data),
+        "신종자본증권 미상환 잔액": drop_empty_fields(new_capital_securities_data),
+        "단기사채 미상환 잔액": drop_empty_fields(short_term_bonds_data),
+        "채무증권 발행실적": drop_empty_fields(debt_issuance_data),
     }
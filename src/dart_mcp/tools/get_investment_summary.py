@@ -5,8 +5,9 @@
     - SRP(단일 책임 원칙): 투자 요약 정보 제공이라는 단일 책임을 갖습니다.
     - OCP(개방-폐쇄 원칙): 향후 새로운 투자 관련 정보 항목이 추가될 경우, 기존 코드를 수정하기보다는 새로운 항목을 추가하는 방식으로 확장 가능하도록 고려합니다. (예: 딕셔너리 키 추가)
 - **기술적 고려사항**:
-    - 비동기 처리: DART API 호출은 네트워크 I/O 작업이므로 `async/await`를 사용하여 비동기적으로 처리하여 효율성을 높입니다.
-    - 오류 처리: 각 API 호출 시 발생할 수 있는 예외를 적절히 처리하여, 일부 정보 조회에 실패하더라도 가능한 다른 정보는 반환할 수 있도록 고려할 수 있습니다. (현재는 기본 에러 전파)
+    - 비동기 처리: DART API 호출은 네트워크 I/O 작업이므로 `async/await`를 사용하며, 서로 독립적인 엔드포인트들은 `asyncio.gather`로 동시에 요청하여 효율성을 높입니다.
+    - 오류 처리: 한 API 호출이 실패해도 해당 항목만 빈 리스트로 대체되고 나머지 정보는 반환됩니다.
+    - 응답 크기: 값이 없는(None 또는 빈 문자열) 필드는 제거하여 LLM에 전달되는 토큰 수를 줄입니다. ("-"는 유지)
 - **사용 시 고려사항**:
     - `corp_code`, `bsns_year`, `reprt_code`는 필수 인자입니다.
     - 반환되는 딕셔너리의 키 값은 한글로 명시되어 있어, 해당 키를 통해 각 정보를 명확히 구분할 수 있습니다.
@@ -14,11 +15,8 @@
 
 from typing import Any
 
-from dart_mcp.api_clients.dart.investment_info import (
-    get_investment_in_subsidiaries,
-    get_private_placement_fund_usage_details,
-    get_public_offering_fund_usage_details,
-)
+from dart_mcp.api_clients.base.dart import drop_empty_fields
+from dart_mcp.api_clients.dart.investment_info import get_all_investment_info
 
 
 async def get_investment_summary(
@@ -35,26 +33,23 @@ async def get_investment_summary(
 
     Returns:
         Dict[str, Any]: 투자 관련 정보들을 담고 있는 딕셔너리.
-                        조회 실패 시 해당 키의 값은 None 또는 에러 메시지가 될 수 있습니다.
-                        (현재는 에러 발생 시 그대로 전파)
+                        조회에 실패한 항목은 오류 로그를 남기고 빈 리스트로 반환합니다.
                         {
-                            "타법인 출자현황": [결과 리스트] or 에러,
-                            "사모자금 사용내역": [결과 리스트] or 에러,
-                            "공모자금 사용내역": [결과 리스트] or 에러
+                            "타법인 출자현황": [결과 리스트],
+                            "사모자금 사용내역": [결과 리스트],
+                            "공모자금 사용내역": [결과 리스트]
                         }
     """
-    investment_in_subsidiaries_data = await get_investment_in_subsidiaries(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    private_placement_fund_data = await get_private_placement_fund_usage_details(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    public_offering_fund_data = await get_public_offering_fund_usage_details(
+    (
+        investment_in_subsidiaries_data,
+        private_placement_fund_data,
+        public_offering_fund_data,
+    ) = await get_all_investment_info(
         corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
     )
 
     return {
-        "타법인 출자현황": investment_in_subsidiaries_data,
-        "사모자금 사용내역": private_placement_fund_data,
-        "공모자금 사용내역": public_offering_fund_data,
+        "타법인 출자현황": drop_empty_fields(investment_in_subsidiaries_data),
+        "사모자금 사용내역": drop_empty_fields(private_placement_fund_data),
+        "공모자금 사용내역": drop_empty_fields(public_offering_fund_data),
     }
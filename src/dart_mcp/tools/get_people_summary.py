@@ -5,8 +5,9 @@
     - SRP(단일 책임 원칙): 인적 자원 요약 정보 제공이라는 단일 책임을 갖습니다.
     - OCP(개방-폐쇄 원칙): 향후 새로운 인적 자원 관련 정보 항목이 추가될 경우 유연하게 확장 가능하도록 합니다.
 - **기술적 고려사항**:
-    - 비동기 처리: DART API 호출은 `async/await`를 사용하여 비동기적으로 처리합니다.
-    - 오류 처리: 각 API 호출의 예외를 적절히 처리하여 안정성을 높입니다.
+    - 비동기 처리: DART API 호출은 `async/await`를 사용하며, 서로 독립적인 엔드포인트들은 `get_all_people_info`(내부적으로 `asyncio.gather`)로 동시에 요청합니다.
+    - 오류 처리: 한 API 호출이 실패해도 해당 항목만 빈 리스트로 대체되고 나머지 정보는 반환됩니다.
+    - 응답 크기: 값이 없는(None 또는 빈 문자열) 필드는 제거하여 LLM에 전달되는 토큰 수를 줄입니다. ("-"는 유지)
 - **사용 시 고려사항**:
     - `corp_code`, `bsns_year`, `reprt_code`는 필수 인자입니다.
     - 반환되는 딕셔너리의 키는 한글로 명시되어 각 정보를 명확히 구분합니다.
@@ -14,14 +15,8 @@
 
 from typing import Any
 
-from dart_mcp.api_clients.dart.people_info import (
-    get_company_employees,
-    get_company_excutives,
-    get_individual_compensation_of_directors_and_auditors,
-    get_individual_compensation_of_unregular_executive_officers,
-    get_outside_directors_info_and_chages,
-    get_top_five_individual_compensation,
-)
+from dart_mcp.api_clients.base.dart import drop_empty_fields
+from dart_mcp.api_clients.dart.people_info import get_all_people_info
 
 
 async def get_people_summary(
@@ -46,34 +41,22 @@ async def get_people_summary(
                             "개인별 보수지급 금액(상위 5명)": ...
                         }
     """
-    employees_data = await get_company_employees(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    executives_data = await get_company_excutives(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    directors_compensation_data = (
-        await get_individual_compensation_of_directors_and_auditors(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-        )
-    )
-    unreg_exec_compensation_data = (
-        await get_individual_compensation_of_unregular_executive_officers(
-            corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-        )
-    )
-    outside_directors_data = await get_outside_directors_info_and_chages(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    top_five_compensation_data = await get_top_five_individual_compensation(
+    (
+        employees_data,
+        executives_data,
+        directors_compensation_data,
+        unreg_exec_compensation_data,
+        outside_directors_data,
+        top_five_compensation_data,
+    ) = await get_all_people_info(
         corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
     )
 
     return {
-        "직원 현황": employees_data,
-        "임원 현황": executives_data,
-        "이사·감사 전체 보수현황": directors_compensation_data,
-        "미등기임원 보수현황": unreg_exec_compensation_data,
-        "사외이사 및 그 변동현황": outside_directors_data,
-        "개인별 보수지급 금액(상위 5명)": top_five_compensation_data,
+        "직원 현황": drop_empty_fields(employees_data),
+        "임원 현황": drop_empty_fields(executives_data),
+        "이사·감사 전체 보수현황": drop_empty_fields(directors_compensation_data),
+        "미등기임원 보수현황": drop_empty_fields(unreg_exec_compensation_data),
+        "사외이사 및 그 변동현황": drop_empty_fields(outside_directors_data),
+        "개인별 보수지급 금액(상위 5명)": drop_empty_fields(top_five_compensation_data),
     }
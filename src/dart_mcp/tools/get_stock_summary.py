@@ -5,8 +5,9 @@
     - SRP(단일 책임 원칙): 주식 요약 정보 제공이라는 단일 책임을 갖습니다.
     - OCP(개방-폐쇄 원칙): 향후 새로운 주식 관련 정보 항목이 추가될 경우 유연하게 확장 가능하도록 합니다.
 - **기술적 고려사항**:
-    - 비동기 처리: DART API 호출은 `async/await`를 사용하여 비동기적으로 처리합니다.
-    - 오류 처리: 각 API 호출의 예외를 적절히 처리하여 안정성을 높입니다.
+    - 비동기 처리: DART API 호출은 `async/await`를 사용하며, 서로 독립적인 엔드포인트들은 `get_all_stock_info`(내부적으로 `asyncio.gather`)로 동시에 요청합니다.
+    - 오류 처리: 한 API 호출이 실패해도 해당 항목만 빈 리스트로 대체되고 나머지 정보는 반환됩니다.
+    - 응답 크기: 값이 없는(None 또는 빈 문자열) 필드는 제거하여 LLM에 전달되는 토큰 수를 줄입니다. ("-"는 유지)
 - **사용 시 고려사항**:
     - `corp_code`, `bsns_year`, `reprt_code`는 필수 인자입니다.
     - 반환되는 딕셔너리의 키는 한글로 명시되어 각 정보를 명확히 구분합니다.
@@ -14,14 +15,8 @@
 
 from typing import Any
 
-from dart_mcp.api_clients.dart.stock_info import (
-    get_acquisition_of_treasury_stock,
-    get_capital_increase_or_decrease_status,
-    get_dividend_status,
-    get_largest_shareholder,
-    get_largest_shareholder_changes,
-    get_minor_stock_status,
-)
+from dart_mcp.api_clients.base.dart import drop_empty_fields
+from dart_mcp.api_clients.dart.stock_info import get_all_stock_info
 
 
 async def get_stock_summary(
@@ -46,30 +41,22 @@ async def get_stock_summary(
                             "자기주식 취득 및 처분현황": ...
                         }
     """
-    largest_shareholder_data = await get_largest_shareholder(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    largest_shareholder_changes_data = await get_largest_shareholder_changes(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    minor_stock_status_data = await get_minor_stock_status(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    dividend_status_data = await get_dividend_status(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    capital_change_data = await get_capital_increase_or_decrease_status(
-        corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
-    )
-    treasury_stock_data = await get_acquisition_of_treasury_stock(
+    (
+        largest_shareholder_data,
+        largest_shareholder_changes_data,
+        minor_stock_status_data,
+        dividend_status_data,
+        capital_change_data,
+        treasury_stock_data,
+    ) = await get_all_stock_info(
         corp_code=corp_code, bsns_year=bsns_year, reprt_code=reprt_code
     )
 
     return {
-        "최대주주 현황": largest_shareholder_data,
-        "최대주주 변동현황": largest_shareholder_changes_data,
-        "소액주주 현황": minor_stock_status_data,
-        "배당에 관한 사항": dividend_status_data,
-        "증자(감자) 현황": capital_change_data,
-        "자기주식 취득 및 처분현황": treasury_stock_data,
+        "최대주주 현황": drop_empty_fields(largest_shareholder_data),
+        "최대주주 변동현황": drop_empty_fields(largest_shareholder_changes_data),
+        "소액주주 현황": drop_empty_fields(minor_stock_status_data),
+        "배당에 관한 사항": drop_empty_fields(dividend_status_data),
+        "증자(감자) 현황": drop_empty_fields(capital_change_data),
+        "자기주식 취득 및 처분현황": drop_empty_fields(treasury_stock_data),
     }
@@ -0,0 +1,4 @@
+import os
+
+# 설정(get_settings)은 필수 값인 DART_API_KEY가 있어야 만들어지므로 테스트용 값을 지정
+os.environ.setdefault("DART_API_KEY", "test")
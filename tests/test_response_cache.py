@@ -0,0 +1,53 @@
+import datetime
+
+import pytest
+
+from dart_mcp.api_clients.base import dart
+from dart_mcp.settings.config import get_settings
+
+
+def _url(bsns_year: int) -> str:
+    return f"alotMatter.json?corp_code=00126380&bsns_year={bsns_year}&reprt_code=11011"
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+    dart._response_cache.clear()
+    yield
+    dart._response_cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """dart 모듈의 time.monotonic을 테스트에서 움직일 수 있는 값으로 바꿉니다."""
+    now = [1000.0]
+    monkeypatch.setattr(dart.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_current_year_no_data_entry_expires_quickly(clock):
+    url = _url(datetime.date.today().year)
+    dart._set_cached_response(url, [])  # 013 (데이터 없음) 응답
+    assert dart._get_cached_response(url) == []
+
+    clock[0] += get_settings().DART_OPEN_PERIOD_CACHE_TTL + 1
+    assert dart._get_cached_response(url) is None
+
+
+def test_closed_year_entry_uses_long_ttl(clock):
+    url = _url(datetime.date.today().year - 1)
+    dart._set_cached_response(url, [{"corp_name": "삼성전자"}])
+
+    clock[0] += get_settings().DART_OPEN_PERIOD_CACHE_TTL + 1
+    assert dart._get_cached_response(url) == [{"corp_name": "삼성전자"}]
+
+    clock[0] += get_settings().DART_CACHE_TTL
+    assert dart._get_cached_response(url) is None
+
+
+def test_closed_year_no_data_entry_expires_quickly(clock):
+    url = _url(datetime.date.today().year - 1)
+    dart._set_cached_response(url, [])  # 보고서가 아직 제출되지 않은 지난 사업연도
+
+    clock[0] += get_settings().DART_OPEN_PERIOD_CACHE_TTL + 1
+    assert dart._get_cached_response(url) is None